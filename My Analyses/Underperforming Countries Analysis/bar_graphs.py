@@ -1,4 +1,5 @@
 import os
+import sys
 import pandas as pd
 import matplotlib.pyplot as plt
 from matplotlib.patches import Patch
@@ -8,21 +9,16 @@ import matplotlib.ticker as mtick
 # Input the most recent date listed on CSV
 latest_date = "2025-07-14"
 script_dir = os.path.dirname(os.path.abspath(__file__))
-csv_filename = f"eci_2024-07-31_to_{latest_date}.csv"
-csv_path = os.path.join(script_dir, "../..", "CSVs", csv_filename)
+sys.path.insert(0, os.path.join(script_dir, "../.."))
+from timeseries_store import open_store
 
-df = pd.read_csv(csv_path)
+store = open_store()
 
 # --- Preprocessing ---
-df["capture_date"] = pd.to_datetime(df["capture_date"], errors="coerce")
-
-# Filters for most recent date and earliest time
-df_latest_date = df[df["capture_date"] == latest_date]
-max_time = df_latest_date["GMT_capture_time"].max()
-df_latest = df_latest_date[
-    (df_latest_date["GMT_capture_time"] == max_time) &
-    (df_latest_date["Country"] != "Total number of signatories")
-]
+# Every country's latest capture up to the end of latest_date
+df_latest = store.as_of(pd.Timestamp(latest_date) + pd.Timedelta(days=1, seconds=-1))
+df_latest = df_latest[df_latest["Country"] != "Total number of signatories"]
+store.close()
 
 # Sorts by statements of support from lowest to highest
 df_latest_sorted = df_latest.sort_values("Statements of Support", ascending=False)
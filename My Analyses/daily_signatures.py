@@ -1,35 +1,26 @@
 import pandas as pd
 import matplotlib.pyplot as plt
 import os
+import sys
 
-# Input the most recent date listed on CSV
-latest_date = "2025-07-14"
 script_dir = os.path.dirname(os.path.abspath(__file__))
-csv_filename = f"eci_2024-07-31_to_{latest_date}.csv"
-csv_path = os.path.join(script_dir, "..", "CSVs", csv_filename)
+sys.path.insert(0, os.path.join(script_dir, ".."))
+from eci_dataset import DEFAULT_INITIATIVE
+from signature_series import load_series, to_wide
+from timeseries_store import open_store
 
-df = pd.read_csv(csv_path)
+store = open_store()
 
 campaign_end_date = pd.to_datetime("2025-07-31")
 
 # --- Preprocessing ---
-df['capture_date'] = pd.to_datetime(df['capture_date'])
-earliest_dataset_date = df['capture_date'].min().date()
-df.sort_values(by='capture_date', inplace=True)
-
-# Select only total number of signatories
-df = df[df['Country'] == 'Total number of signatories']
-
-# Pivot (will create a single column named 'Total number of signatories')
-pivot_df = df.pivot_table(
-    index='capture_date',
-    columns='Country',
-    values='Statements of Support',
-    aggfunc='last'
-)
-
-# Compute daily new signatures
-daily_signatures = pivot_df.diff().fillna(0).astype(int)
+# Last capture of each day for the total only (a single column named 'Total number of signatories')
+pivot_df = store.resample("D", countries=["Total number of signatories"])
+store.close()
+
+# Daily new signatures from the gap-filled series, so a skipped week is not one spike
+series = load_series("D", initiative_id=DEFAULT_INITIATIVE)
+daily_signatures = to_wide(series, "daily_rate")[pivot_df.columns].fillna(0).round().astype(int)
 
 # --- Plotting ---
 fig, (ax1, ax2) = plt.subplots(nrows=2, ncols=1, figsize=(12, 10), sharex=True)
@@ -0,0 +1,180 @@
+import os
+import sys
+from datetime import timedelta
+import numpy as np
+import pandas as pd
+import matplotlib.pyplot as plt
+import matplotlib.dates as mdates
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(script_dir, ".."))
+from eci_dataset import load_eci_data
+from signature_series import build_series, to_wide
+
+CAMPAIGN_END_DATE = pd.to_datetime("2025-07-31")
+TOTAL_ROW = "Total number of signatories"
+
+class SignatureAnalysis:
+    # Loads the dataset once and works out every country's daily gains,
+    # required rate and linear projection in one pass over the pivot.
+    def __init__(self, df, campaign_end_date=CAMPAIGN_END_DATE):
+        df = df.sort_values(by='capture_date')
+        self.campaign_end_date = campaign_end_date
+        self.earliest_dataset_date = df['capture_date'].min().date()
+
+        # Pivot: Date x Country -> Signature Count
+        self.pivot_df = df.pivot_table(
+            index='capture_date',
+            columns='Country',
+            values='Statements of Support',
+            aggfunc='last',
+            observed=True
+        )
+        # Gains on a regular daily grid, so a skipped week is spread over its days
+        self.series = build_series(df)
+        self.daily_signatures = to_wide(self.series, "daily_rate").fillna(0).round().astype(int)
+        self.imputed = to_wide(self.series, "imputed")
+
+        latest = self.pivot_df.ffill().iloc[-1]
+        thresholds = df.groupby('Country', observed=True)['Threshold'].last()
+
+        self.current_date = self.pivot_df.index.max()
+        self.days_remaining = (campaign_end_date - self.current_date).days
+
+        summary = pd.DataFrame({"current": latest, "threshold": thresholds})
+        summary["remaining"] = summary["threshold"] - summary["current"]
+        if self.days_remaining > 0:
+            summary["daily_needed"] = (summary["remaining"] / self.days_remaining).clip(lower=0)
+        else:
+            summary["daily_needed"] = 0.0
+        self.summary = summary
+
+        # Extrapolated goal for every country: current + i * daily_needed
+        future_dates = pd.date_range(start=self.current_date, end=campaign_end_date, freq='D')
+        steps = np.arange(len(future_dates))[:, None]
+        self.linear_projection = pd.DataFrame(
+            summary["current"].to_numpy(dtype=float) + steps * summary["daily_needed"].to_numpy(dtype=float),
+            index=future_dates,
+            columns=summary.index,
+        )
+
+    @classmethod
+    def load(cls, campaign_end_date=CAMPAIGN_END_DATE, **kwargs):
+        return cls(load_eci_data(**kwargs), campaign_end_date)
+
+    def countries(self):
+        return [c for c in self.summary.index if c != TOTAL_ROW]
+
+def print_country_summary(analysis, country):
+    row = analysis.summary.loc[country]
+    print(f"As of {analysis.current_date.date()}, {country} has {int(row['current']):,} signatures.")
+    print(f"To reach the threshold of {int(row['threshold'])} by {analysis.campaign_end_date.date()},")
+    print(f"They need to collect {int(row['daily_needed'])} signatures per day "
+          f"for the remaining {analysis.days_remaining} days.")
+
+def plot_country_projection(analysis, country, daily_ylim=None, cumulative_ylim=None):
+    campaign_end_date = analysis.campaign_end_date
+    earliest_dataset_date = analysis.earliest_dataset_date
+    threshold = analysis.summary.loc[country, "threshold"]
+    current_signatures = analysis.summary.loc[country, "current"]
+    daily_needed = analysis.summary.loc[country, "daily_needed"]
+    pivot_df = analysis.pivot_df
+    daily_signatures = analysis.daily_signatures
+    linear_projection = analysis.linear_projection[country]
+
+    # --- Plotting ---
+    fig, (ax1, ax2) = plt.subplots(nrows=2, ncols=1, figsize=(12, 10), sharex=True)
+
+    # Plot 1: Daily new signatures (actual)
+    ax1.plot(daily_signatures.index, daily_signatures[country], label='Daily Signatures', color='tab:blue')
+
+    # Plot required daily rate as a horizontal dashed line
+    ax1.axhline(y=daily_needed, color='tab:green', linestyle='--', label=f'Required Daily Rate')
+
+    # Vertical deadline line
+    ax1.axvline(x=campaign_end_date, color='black', linestyle='--', alpha=0.7, label='Deadline (July 31)')
+
+    ax1.set_ylabel("Daily Signature Count")
+    ax1.legend(loc='upper left')
+    if daily_ylim is not None:
+        ax1.set_ylim(0, daily_ylim)
+
+    # Label box with needed daily rate
+    midpoint_date = earliest_dataset_date + (campaign_end_date.date() - earliest_dataset_date) / 2
+    midpoint_date = pd.to_datetime(midpoint_date)
+
+    ax1.text(
+        midpoint_date,
+        daily_needed + 10,  # slightly above the dashed line
+        f"{int(daily_needed)} signatures/day needed",
+        color='tab:green',
+        ha='center',
+        va='bottom',
+        fontsize=11,
+        bbox=dict(boxstyle="round,pad=0.3", facecolor="white", edgecolor="tab:green")
+    )
+
+    # Plot 2: Cumulative actual + projection
+    ax2.plot(pivot_df.index, pivot_df[country], label='Cumulative Signatures', color='tab:red')
+    ax2.plot(linear_projection.index, linear_projection.values, label='Projected Path to Threshold', linestyle='--', color='tab:green')
+    ax2.axhline(y=threshold, color='gray', linestyle=':', label='Threshold')
+    ax2.axvline(x=campaign_end_date, color='black', linestyle='--', alpha=0.7)
+
+    ax2.set_ylabel("Cumulative Signatures")
+    ax2.grid(True, linestyle='--', alpha=0.25)
+    ax2.legend(loc='upper left', bbox_to_anchor=(0, 0.925))
+    if cumulative_ylim is not None:
+        ax2.set_ylim(0, cumulative_ylim)
+
+    # Set ticks and format on shared x-axis
+    ax2.xaxis.set_major_locator(mdates.MonthLocator())
+    ax2.xaxis.set_major_formatter(mdates.DateFormatter('%b %Y'))
+    plt.setp(ax2.get_xticklabels(), rotation=45, ha='right')
+
+    fig.suptitle(f"{country} Signatures & Projection to Reach Threshold by July 31st",
+                 fontsize=20, x=0.53, y=0.97)
+    ax2.set_xlim(earliest_dataset_date, campaign_end_date + timedelta(days=30))
+
+    fig.tight_layout()
+    fig.subplots_adjust(top=0.93)
+
+    # --- Annotation: Remaining signatures needed ---
+    remaining_needed = threshold - current_signatures
+
+    # Coordinates for the annotation
+    x_pos = campaign_end_date + timedelta(days=3)  # Shift right a bit from the deadline
+    y_start = current_signatures
+    y_end = threshold
+
+    # Draw short horizontal lines at current and target signature levels
+    ax2.hlines(y=y_start, xmin=x_pos - timedelta(days=1), xmax=x_pos + timedelta(days=1), colors='black')
+    ax2.hlines(y=y_end, xmin=x_pos - timedelta(days=1), xmax=x_pos + timedelta(days=1), colors='black')
+
+    # Draw vertical double arrow between the two horizontal lines
+    ax2.annotate(
+        '',
+        xy=(x_pos, y_end),
+        xytext=(x_pos, y_start),
+        arrowprops=dict(arrowstyle='<->', color='black', lw=1.5),
+    )
+
+    # Add a text label to the right of the arrow
+    ax2.text(
+        x_pos + timedelta(days=3),
+        (y_start + y_end) / 2,
+        f"{int(remaining_needed):,} \nneeded",
+        va='center',
+        ha='left',
+        fontsize=10,
+        bbox=dict(boxstyle='round,pad=0.3', facecolor='white', edgecolor='gray')
+    )
+
+    return fig
+
+def print_status(analysis):
+    report = analysis.summary.drop(index=TOTAL_ROW, errors="ignore").sort_values("remaining", ascending=False)
+    print(f"📊 Status as of {analysis.current_date.date()} ({analysis.days_remaining} days remaining)\n")
+    print(report.round(1).to_string())
+
+if __name__ == "__main__":
+    print_status(SignatureAnalysis.load())
@@ -3,32 +3,25 @@ import matplotlib.pyplot as plt
 from matplotlib.patches import Patch
 from datetime import timedelta
 import os
+import sys
 
-# Input the most recent date listed on CSV
-latest_date = "2025-07-14"
 script_dir = os.path.dirname(os.path.abspath(__file__))
-csv_filename = f"eci_2024-07-31_to_{latest_date}.csv"
-csv_path = os.path.join(script_dir, "..", "CSVs", csv_filename)
-
-df = pd.read_csv(csv_path)
+sys.path.insert(0, os.path.join(script_dir, ".."))
+from crossing_index import open_crossing_index
+from eci_dataset import DEFAULT_INITIATIVE, load_eci_data
 
 # === Preprocessing ===
-df['capture_date'] = pd.to_datetime(df['capture_date'])
-
-earliest_dataset_date = df['capture_date'].min().date()
+earliest_dataset_date = load_eci_data(columns=["capture_date"])['capture_date'].min().date()
 campaign_end_date = pd.to_datetime("2025-07-31")
 
-# Filter for all instances where any country has surpassed its threshold value
-df_edited  = df[
-    (df["Country"] != "Total number of signatories") &
-    (df["Statements of Support"] > df["Threshold"])
-]
+# First capture where each country passed its threshold, from the precomputed index
+crossings = open_crossing_index()
 
-# Get the first date each country passed its threshold
-first_passed = (
-    df_edited.sort_values("capture_date")
-    .drop_duplicates(subset="Country", keep="first")
-)
+first_passed = crossings[
+    (crossings["initiative_id"] == DEFAULT_INITIATIVE) &
+    crossings["first_crossed_ts"].notna()
+].copy()
+first_passed["capture_date"] = first_passed["first_crossed_ts"].dt.normalize()
 
 # === Dictionary for region mapping ===
 region_map = {
@@ -82,9 +75,8 @@ fig, ax = plt.subplots(figsize=(10, 8))
 ax.scatter(df_unique["capture_date"], df_unique["order"], color=df_unique["Color"], s=80)
 
 # Horizontal lines with color per point
-for _, row in df_unique.iterrows():
-    ax.hlines(y=row["order"], xmin=earliest_dataset_date, xmax=row["capture_date"],
-          color=row["Color"], linewidth=2)
+ax.hlines(y=df_unique["order"], xmin=pd.Timestamp(earliest_dataset_date), xmax=df_unique["capture_date"],
+          colors=df_unique["Color"], linewidth=2)
 
 # Tidy up axis
 ax.set_yticks(df_unique["order"])
@@ -0,0 +1,114 @@
+import argparse
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import matplotlib
+matplotlib.use("Agg")  # headless: workers only ever write files
+import matplotlib.pyplot as plt
+import pandas as pd
+
+script_dir = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, script_dir)
+from eci_analysis import CAMPAIGN_END_DATE, SignatureAnalysis, plot_country_projection
+from eci_dataset import load_eci_data
+
+DEFAULT_OUTPUT_DIR = os.path.join(script_dir, "Reports")
+MANIFEST_NAME = "render_manifest.json"
+
+_analyses = {}
+
+def _init_worker(analyses):
+    _analyses.update(analyses)
+
+def render_country(initiative_id, country, out_dir, formats):
+    fig = plot_country_projection(_analyses[initiative_id], country)
+    paths = []
+    for fmt in formats:
+        path = os.path.join(out_dir, f"{country.replace(' ', '_')}.{fmt}")
+        fig.savefig(path, format=fmt)
+        paths.append(path)
+    plt.close(fig)
+    return paths
+
+def chart_fingerprint(analysis, country):
+    # Everything the chart is drawn from; unchanged inputs mean an unchanged figure
+    h = hashlib.sha256()
+    h.update(pd.util.hash_pandas_object(analysis.pivot_df[country].dropna(), index=True).values.tobytes())
+    h.update(pd.util.hash_pandas_object(analysis.daily_signatures[country], index=True).values.tobytes())
+    h.update(str(analysis.earliest_dataset_date).encode())
+    h.update(repr(analysis.summary.loc[country].round(6).tolist()).encode())
+    h.update(str(analysis.campaign_end_date).encode())
+    return h.hexdigest()
+
+def load_manifest(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def save_manifest(path, manifest):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, path)
+
+def load_analyses(initiative_id=None, campaign_end_date=CAMPAIGN_END_DATE):
+    # Load once, analyse each initiative once
+    df = load_eci_data(initiative_id=initiative_id)
+    return {
+        str(initiative_id): SignatureAnalysis(group, campaign_end_date)
+        for initiative_id, group in df.groupby("initiative_id", observed=True)
+    }
+
+def render_reports(analyses, out=DEFAULT_OUTPUT_DIR, formats=("png",), workers=None, force=False):
+    manifest_path = os.path.join(out, MANIFEST_NAME)
+    manifest = {} if force else load_manifest(manifest_path)
+
+    jobs = []
+    skipped = 0
+    for initiative_id, analysis in analyses.items():
+        out_dir = os.path.join(out, initiative_id.replace("/", "_"))
+        os.makedirs(out_dir, exist_ok=True)
+        for country in analysis.countries():
+            key = f"{initiative_id}|{country}"
+            fingerprint = chart_fingerprint(analysis, country)
+            outputs = [os.path.join(out_dir, f"{country.replace(' ', '_')}.{fmt}") for fmt in formats]
+            if manifest.get(key) == fingerprint and all(os.path.exists(p) for p in outputs):
+                skipped += 1
+                continue
+            jobs.append((key, fingerprint, initiative_id, country, out_dir))
+
+    print(f"🖼️  {len(jobs)} charts to render, {skipped} unchanged")
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(analyses,)) as executor:
+        futures = {
+            executor.submit(render_country, initiative_id, country, out_dir, formats): (key, fingerprint)
+            for key, fingerprint, initiative_id, country, out_dir in jobs
+        }
+        for future in as_completed(futures):
+            key, fingerprint = futures[future]
+            try:
+                paths = future.result()
+            except Exception as e:
+                print(f"❌ Failed to render {key}: {e}")
+                continue
+            manifest[key] = fingerprint
+            print(f"✅ {key} -> {', '.join(os.path.basename(p) for p in paths)}")
+
+    os.makedirs(out, exist_ok=True)
+    save_manifest(manifest_path, manifest)
+    print(f"\n📁 Reports saved to {out}")
+    return len(jobs)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Render every country's projection chart to files.")
+    parser.add_argument("--out", default=DEFAULT_OUTPUT_DIR)
+    parser.add_argument("--formats", nargs="+", default=["png"], choices=["png", "svg", "pdf"])
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--initiative", help="Only render this initiative ID (default: all)")
+    parser.add_argument("--force", action="store_true", help="Re-render even if inputs are unchanged")
+    args = parser.parse_args()
+
+    render_reports(load_analyses(args.initiative), args.out, args.formats, args.workers, args.force)
@@ -0,0 +1,200 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+import aiohttp
+import pandas as pd
+from http_engine import USER_AGENT
+from page_classifier import PREFIX_CHARS, classify_page
+from retry_scheduler import RetryPolicy, RetryScheduler, parse_retry_after
+from scrape_metrics import timed
+from snapshot_table import parse_table_rows, raw_snapshot_url, rows_to_snapshot_df
+
+class TokenBucket:
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.capacity = burst
+        self.tokens = burst
+        self.updated = time.monotonic()
+
+    async def acquire(self):
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+class HostRateLimiter:
+    def __init__(self, rate=5.0, burst=10):
+        self.rate = rate
+        self.burst = burst
+        self.buckets = {}
+
+    async def acquire(self, url):
+        host = urlparse(url).netloc
+        if host not in self.buckets:
+            self.buckets[host] = TokenBucket(self.rate, self.burst)
+        await self.buckets[host].acquire()
+
+async def fetch_page(session, url, limiter, cache=None, info=None, raw=False):
+    # One attempt: (html, None) on success, (None, "no_data") for a page classified as empty,
+    # else (None, "exception"); retries are left to the caller's RetryScheduler
+    if cache is not None:
+        with timed(info, "cache"):
+            html = cache.get(url)
+        if html is not None:
+            return html, None
+
+    fetch_url = raw_snapshot_url(url) if raw else url
+    await limiter.acquire(url)
+    try:
+        with timed(info, "fetch"):
+            async with session.get(fetch_url) as response:
+                html = await response.text()
+                verdict = classify_page(fetch_url, str(response.url), html[:PREFIX_CHARS], response.status)
+                if (response.status >= 400 or verdict is not None) and info is not None:
+                    info["retry_after"] = parse_retry_after(response.headers.get("Retry-After"))
+                if verdict is None:
+                    response.raise_for_status()
+    except Exception as e:
+        print(f"❌ Exception for URL {url}: {e!r}")
+        return None, "exception"
+
+    if verdict is None:
+        if cache is not None:
+            cache.put(url, html)
+        return html, None
+
+    status, reason = verdict
+    print(f"⛔ Aborted ({reason}, HTTP {response.status}): {url}")
+    if info is not None:
+        info["reason"] = reason
+    # A missing or moved capture is an answer, not a failure worth retrying
+    return None, status
+
+async def scrape_all_async(url_list, concurrency=32, rate=5.0, burst=10, retries=3, base_delay=5,
+                           timeout=20, parse_workers=2, fallback=None, fallback_workers=2, cache=None, writer=None,
+                           journal=None, metrics=None, raw=False, negative_cache=None):
+    results = []
+    limiter = HostRateLimiter(rate, burst)
+    scheduler = RetryScheduler(url_list, retries=retries, policy=RetryPolicy(base_delay))
+    in_flight = 0
+    # Set whenever a URL finishes, so idle fetchers look again for a retry that was just queued
+    progress = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    # Browser fallbacks get their own small executor so they never outnumber the driver pool
+    fallback_executor = ThreadPoolExecutor(max_workers=fallback_workers) if fallback is not None else None
+
+    # Bounded hand-off: fetchers stall once the parsers fall behind
+    html_queue = asyncio.Queue(maxsize=concurrency)
+
+    async def fetcher(session):
+        nonlocal in_flight
+        while True:
+            url = scheduler.next_ready()
+            if url is None:
+                if not scheduler.pending() and not in_flight:
+                    return
+                # URLs backing off wait in the scheduler, not asleep in a fetcher
+                progress.clear()
+                try:
+                    await asyncio.wait_for(progress.wait(), timeout=scheduler.next_delay())
+                except asyncio.TimeoutError:
+                    pass
+                continue
+
+            in_flight += 1
+            info = {}
+            html, status = await fetch_page(session, url, limiter, cache, info, raw)
+            delay = scheduler.complete(url, status or "success", retry_after=info.get("retry_after"))
+            if delay is not None:
+                print(f"🔁 Retry {scheduler.attempts[url]}/{retries} for {url} in {delay:.0f}s...")
+                if metrics is not None:
+                    metrics.observe(info, status, final=False)
+            else:
+                await html_queue.put((url, html, status, info))
+            in_flight -= 1
+            progress.set()
+
+    async def parser():
+        while True:
+            item = await html_queue.get()
+            if item is None:
+                return
+            url, html, status, info = item
+            if status == "no_data":
+                df = None
+            elif html is None:
+                results.append((url, None, "exception"))
+                if metrics is not None:
+                    metrics.observe(info, "exception")
+                if journal is not None:
+                    journal.record(url, "exception", attempts=scheduler.attempts[url])
+                continue
+            else:
+                with timed(info, "parse"):
+                    rows = await asyncio.to_thread(parse_table_rows, html)
+                if not rows and fallback is not None:
+                    print(f"↪️  No table in static HTML, falling back to Selenium: {url}")
+                    with timed(info, "fallback"):
+                        df, status = await loop.run_in_executor(fallback_executor, fallback, url, info)
+                else:
+                    with timed(info, "build"):
+                        df, status = rows_to_snapshot_df(url, rows, info)
+            if metrics is not None:
+                metrics.observe(info, status)
+            # Stream rows out as they arrive instead of holding every page's frame
+            if writer is not None and status == "success":
+                writer.write(df)
+                df = None
+            if status == "no_data" and negative_cache is not None:
+                negative_cache.record(url, info.get("reason"))
+            if journal is not None:
+                journal.record(url, status, attempts=scheduler.attempts[url])
+            results.append((url, df, status))
+
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
+    async with aiohttp.ClientSession(connector=connector, timeout=client_timeout,
+                                     headers={"User-Agent": USER_AGENT}) as session:
+        parsers = [asyncio.create_task(parser()) for _ in range(parse_workers)]
+        await asyncio.gather(*(fetcher(session) for _ in range(min(concurrency, len(url_list)) or 1)))
+        for _ in parsers:
+            await html_queue.put(None)
+        await asyncio.gather(*parsers)
+
+    if scheduler.retried or scheduler.breaker.trips:
+        print(f"🔁 {scheduler.retried} retries scheduled | circuit breaker tripped {scheduler.breaker.trips} times")
+    if fallback_executor is not None:
+        fallback_executor.shutdown()
+    return results
+
+def save_all_async(url_list, concurrency=32, rate=5.0, burst=10, retries=3, fallback=None, **kwargs):
+    results = asyncio.run(scrape_all_async(url_list, concurrency=concurrency, rate=rate, burst=burst,
+                                           retries=retries, fallback=fallback, **kwargs))
+
+    all_dfs = []
+    exception_urls = []
+    nodata_urls = []
+
+    success_log = []
+    exception_log = []
+    nodata_log = []
+
+    for url, df, status in results:
+        if status == "success":
+            if df is not None:
+                all_dfs.append(df)
+            success_log.append(f"✅ Success: {url}")
+        elif status == "no_data":
+            nodata_urls.append(url)
+            nodata_log.append(f"⚠️  No valid data found for: {url}")
+        elif status == "exception":
+            exception_urls.append(url)
+            exception_log.append(f"❌ Exception occurred while scraping: {url}")
+
+    merged = pd.concat(all_dfs, ignore_index=True) if all_dfs else None
+    return merged, exception_urls, nodata_urls, success_log, exception_log, nodata_log, None
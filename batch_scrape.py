@@ -0,0 +1,122 @@
+import argparse
+import os
+import time
+from itertools import chain, zip_longest
+from cdx_client import CDX_ENDPOINT, WAYBACK_PREFIX, initiative_url, list_snapshots
+from crossing_index import INDEX_PATH, ingest
+from eci_dataset import DATASET_DIR, append_to_dataset
+from driver_pool import RENDER_PROFILES
+from get_snapshot_data import OUTPUT_CHUNK_ROWS, print_summary, run_scrape
+from master_dataset import TEXT_CSV, load_master, save_scrape_results, scraped_urls
+from negative_cache import NEGATIVE_CACHE_PATH, NegativeCache, skip_known_empty
+from page_cache import PageCache
+from row_writer import RowWriter
+from scrape_journal import ScrapeJournal
+from scrape_metrics import ScrapeMetrics
+from snapshot_table import add_initiative_id
+from timeseries_store import STORE_PATH, ingest as ingest_timeseries
+
+# Scrapes many ECI initiatives in one run: every initiative is listed via
+# CDX, then all snapshots share one worker pool.
+
+def read_manifest(path):
+    with open(path, "r", encoding="utf-8") as f:
+        lines = (line.split("#", 1)[0].strip() for line in f)
+        return [line for line in lines if line]
+
+def interleave(url_lists):
+    # Round-robin so one big initiative cannot starve the others in the queue
+    return [url for url in chain.from_iterable(zip_longest(*url_lists)) if url is not None]
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="List and scrape snapshots for many ECI initiatives at once.")
+    parser.add_argument("initiatives", nargs="*", help="Initiative IDs such as 2024/000007")
+    parser.add_argument("--manifest", help="File with one initiative ID per line")
+    parser.add_argument("--engine", choices=["selenium", "http", "async"], default="http")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--rate", type=float, default=5.0, help="Requests per second per host for the async engine")
+    parser.add_argument("--burst", type=int, default=10, help="Requests the async engine may send at once per host")
+    parser.add_argument("--endpoint", default=CDX_ENDPOINT)
+    parser.add_argument("--wayback-prefix", default=WAYBACK_PREFIX)
+    parser.add_argument("--collapse", default="digest")
+    parser.add_argument("--cache-dir", default="page_cache")
+    parser.add_argument("--master", default="CSVs/eci_all_initiatives.csv")
+    parser.add_argument("--dataset", default=DATASET_DIR, help="Partitioned Parquet dataset to update")
+    parser.add_argument("--crossing-index", default=INDEX_PATH, help="Threshold first-crossing index to update")
+    parser.add_argument("--timeseries", default=STORE_PATH, help="SQLite time-series store to update")
+    parser.add_argument("--staging", default="batch_rows.partial.csv",
+                        help="Append-only CSV that rows stream into; a killed run resumes from it")
+    parser.add_argument("--journal", default="batch_journal.sqlite3",
+                        help="Per-URL progress journal; a restarted batch only scrapes outstanding URLs")
+    parser.add_argument("--negative-cache", default=NEGATIVE_CACHE_PATH,
+                        help="Snapshots known to have no data; skipped and kept up to date across runs")
+    parser.add_argument("--render-profile", choices=RENDER_PROFILES, default="full",
+                        help="Browser profile for pages that need JavaScript rendering")
+    parser.add_argument("--raw", action="store_true",
+                        help="http/async: download the original archived bytes (<timestamp>id_ URLs)")
+    parser.add_argument("--metrics-json", metavar="PATH", help="Write per-stage latency percentiles as JSON")
+    parser.add_argument("--metrics-prom", metavar="PATH", help="Write the same metrics as a Prometheus textfile")
+    args = parser.parse_args()
+
+    initiative_ids = list(args.initiatives)
+    if args.manifest:
+        initiative_ids += read_manifest(args.manifest)
+    if not initiative_ids:
+        parser.error("give initiative IDs or --manifest")
+
+    base_dir = os.path.dirname(os.path.abspath(__file__))
+    links_dir = os.path.join(base_dir, "Snapshot Links")
+
+    # === Listing ===
+    writer = RowWriter(args.staging, transform=add_initiative_id)
+    journal = ScrapeJournal(args.journal)
+    journal.forget(journal.unsaved(writer.resumed_urls))
+    already_scraped = scraped_urls(load_master(args.master)) | writer.resumed_urls
+    url_lists = []
+    for initiative_id in initiative_ids:
+        written, links_path, _ = list_snapshots(initiative_url(initiative_id), links_dir,
+                                                endpoint=args.endpoint, collapse=args.collapse,
+                                                prefix=args.wayback_prefix)
+        with open(links_path, "r", encoding="utf-8") as f:
+            urls = [line.strip() for line in f if line.strip() and line.strip() not in already_scraped]
+        urls = journal.outstanding(urls)
+        url_lists.append(urls)
+        print(f"🗂️  {initiative_id}: {written} new snapshots listed, {len(urls)} to scrape")
+
+    # === Scraping ===
+    negative_cache = NegativeCache(args.negative_cache)
+    eci_urls, _ = skip_known_empty(interleave(url_lists), negative_cache)
+    cache = PageCache(args.cache_dir)
+    metrics = ScrapeMetrics()
+
+    start_time = time.time()
+    _, exceptions, nodata, success_log, exception_log, nodata_log, pool_stats = run_scrape(
+        eci_urls, engine=args.engine, max_threads=args.workers, concurrency=args.workers, cache=cache, writer=writer,
+        journal=journal, metrics=metrics, render_profile=args.render_profile,
+        raw=args.raw, negative_cache=negative_cache, rate=args.rate, burst=args.burst
+    )
+    duration = time.time() - start_time
+    negative_cache.close()
+
+    print_summary(success_log, nodata_log, exception_log, duration, pool_stats=pool_stats, cache_stats=cache.stats())
+    metrics.print_table(duration)
+    if args.metrics_json:
+        metrics.write_json(args.metrics_json, duration)
+    if args.metrics_prom:
+        metrics.write_prometheus(args.metrics_prom, duration)
+    print(f"🚀 Throughput: {len(eci_urls) / duration * 60 if duration else 0:.1f} URLs/min "
+          f"across {len(initiative_ids)} initiatives")
+
+    if writer.has_rows():
+        for chunk in writer.read(chunksize=OUTPUT_CHUNK_ROWS):
+            append_to_dataset(chunk, args.dataset)
+            ingest(chunk, args.crossing_index)
+            ingest_timeseries(chunk, args.timeseries)
+        filename, _ = save_scrape_results(writer.read(**TEXT_CSV), args.master)
+        writer.discard()
+        print(f"📦 {writer.rows} rows saved to {filename} and {args.dataset}")
+    else:
+        writer.discard()
+    journal.reset()
+
+    print("\n🎉 Batch complete.")
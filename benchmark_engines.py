@@ -0,0 +1,48 @@
+import argparse
+import threading
+import time
+from datetime import datetime, timedelta
+from async_engine import save_all_async
+from get_snapshot_data import save_all_with_threads
+from stub_server import serve
+
+# Compares the threaded http engine with the async pipeline against the
+# local stub server, so latency can be dialled in without touching Wayback.
+
+def stub_urls(port, count):
+    base = f"http://127.0.0.1:{port}/web"
+    origin = "https://citizens-initiative.europa.eu/initiatives/details/2024/000007_en"
+    start = datetime(2025, 1, 1)
+    return [f"{base}/{(start + timedelta(minutes=i)):%Y%m%d%H%M%S}/{origin}" for i in range(count)]
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark snapshot engines against the stub server.")
+    parser.add_argument("fixtures_dir", help="Folder with default.html (and optional <timestamp>.html)")
+    parser.add_argument("--count", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.5)
+    parser.add_argument("--threads", type=int, default=4)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--rate", type=float, default=100.0)
+    args = parser.parse_args()
+
+    server = serve(args.fixtures_dir, port=0, latency=args.latency)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    urls = stub_urls(server.server_port, args.count)
+
+    results = {}
+
+    start = time.time()
+    save_all_with_threads(urls, max_threads=args.threads, retries=1, engine="http")
+    results[f"http ({args.threads} threads)"] = time.time() - start
+
+    start = time.time()
+    save_all_async(urls, concurrency=args.concurrency, rate=args.rate, burst=args.concurrency, retries=1)
+    results[f"async ({args.concurrency} in flight)"] = time.time() - start
+
+    server.shutdown()
+
+    print("\n" + "=" * 60)
+    print(f"🏁 {args.count} pages @ {args.latency:.2f}s latency")
+    print("=" * 60)
+    for name, seconds in results.items():
+        print(f"{name:<28} {seconds:8.2f}s | {args.count / seconds * 60:8.1f} URLs/min")
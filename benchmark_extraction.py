@@ -0,0 +1,72 @@
+import argparse
+import statistics
+import threading
+import time
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+from benchmark_engines import stub_urls
+from driver_pool import launch_driver
+from get_snapshot_data import read_table_rows
+from snapshot_table import parse_table_rows
+from stub_server import serve
+
+# Times only the table extraction step of the Selenium engine, on a page
+# that is already loaded: the old per-cell WebDriver calls against the
+# single execute_script round-trip and a page_source + local parse.
+
+def extract_per_cell(driver):
+    rows = driver.find_elements(By.CSS_SELECTOR, "table tr")
+    return [[col.text for col in row.find_elements(By.TAG_NAME, "td")] for row in rows]
+
+def extract_script(driver):
+    return read_table_rows(driver)[0]
+
+def extract_page_source(driver):
+    return parse_table_rows(driver.page_source)
+
+METHODS = {
+    "per-cell (old)": extract_per_cell,
+    "execute_script": extract_script,
+    "page_source": extract_page_source,
+}
+
+def normalized(rows):
+    return [[" ".join(cell.split()) for cell in row] for row in rows]
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark per-page table extraction in the Selenium engine.")
+    parser.add_argument("fixtures_dir", help="Folder with default.html (and optional <timestamp>.html)")
+    parser.add_argument("--count", type=int, default=20)
+    args = parser.parse_args()
+
+    server = serve(args.fixtures_dir, port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    driver = launch_driver()
+
+    timings = {name: [] for name in METHODS}
+    mismatches = 0
+    try:
+        for url in stub_urls(server.server_port, args.count):
+            driver.get(url)
+            WebDriverWait(driver, 10).until(EC.presence_of_element_located((By.CSS_SELECTOR, "table tr")))
+
+            outputs = {}
+            for name, extract in METHODS.items():
+                start = time.perf_counter()
+                outputs[name] = extract(driver)
+                timings[name].append(time.perf_counter() - start)
+
+            baseline = normalized(outputs["per-cell (old)"])
+            mismatches += sum(normalized(rows) != baseline for rows in outputs.values())
+    finally:
+        driver.quit()
+        server.shutdown()
+
+    print("\n" + "=" * 60)
+    print(f"🏁 Table extraction over {args.count} pages")
+    print("=" * 60)
+    for name, values in timings.items():
+        print(f"{name:<18} mean {statistics.mean(values) * 1000:8.1f} ms | "
+              f"median {statistics.median(values) * 1000:8.1f} ms")
+    print(f"\nOutputs differing from the per-cell extraction: {mismatches}")
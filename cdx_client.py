@@ -0,0 +1,137 @@
+import json
+import os
+import re
+from datetime import datetime
+from http_engine import create_session
+
+CDX_ENDPOINT = "https://web.archive.org/cdx/search/cdx"
+WAYBACK_PREFIX = "https://web.archive.org/web"
+
+def initiative_url(initiative_id):
+    return f"https://citizens-initiative.europa.eu/initiatives/details/{initiative_id}_en"
+
+def initiative_slug(url):
+    match = re.search(r'/initiatives/details/(\d{4})/(\d{6})', url)
+    return f"{match.group(1)}_{match.group(2)}" if match else re.sub(r'\W+', '_', url).strip('_')
+
+def archive_url(record, prefix=WAYBACK_PREFIX):
+    return f"{prefix}/{record['timestamp']}/{record['original']}"
+
+def cdx_params(url, collapse=None, from_ts=None, page_size=1000, resume_key=None):
+    # Filters and collapsing run server-side so duplicates never reach us
+    params = [
+        ("url", url),
+        ("output", "json"),
+        ("filter", "statuscode:200"),
+        ("filter", "mimetype:text/html"),
+        ("limit", str(page_size)),
+        ("showResumeKey", "true"),
+    ]
+    if collapse:
+        params.append(("collapse", collapse))
+    if from_ts:
+        params.append(("from", from_ts))
+    if resume_key:
+        params.append(("resumeKey", resume_key))
+    return params
+
+def parse_cdx_page(rows):
+    if not rows:
+        return [], None
+
+    resume_key = None
+    if len(rows) >= 2 and rows[-2] == []:
+        resume_key = rows[-1][0]
+        rows = rows[:-2]
+
+    header, body = rows[0], rows[1:]
+    records = [dict(zip(header, row)) for row in body if len(row) == len(header)]
+    return records, resume_key
+
+def iter_cdx_pages(session, url, endpoint=CDX_ENDPOINT, collapse=None, from_ts=None,
+                   page_size=1000, resume_key=None, timeout=60):
+    while True:
+        params = cdx_params(url, collapse=collapse, from_ts=from_ts, page_size=page_size, resume_key=resume_key)
+        response = session.get(endpoint, params=params, timeout=timeout)
+        response.raise_for_status()
+        rows = response.json() if response.text.strip() else []
+
+        records, resume_key = parse_cdx_page(rows)
+        yield records, resume_key
+        if not resume_key:
+            return
+
+def load_state(state_path):
+    if not os.path.exists(state_path):
+        return {}
+    with open(state_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def save_state(state_path, state):
+    tmp_path = f"{state_path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(state, f)
+    os.replace(tmp_path, state_path)
+
+def last_recorded_timestamp(records_path):
+    last = None
+    if os.path.exists(records_path):
+        with open(records_path, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    last = json.loads(line)["timestamp"]
+    return last
+
+def list_snapshots(url, out_dir, endpoint=CDX_ENDPOINT, collapse="digest", page_size=1000,
+                   resume=True, session=None, prefix=WAYBACK_PREFIX, timeout=60):
+    slug = initiative_slug(url)
+    os.makedirs(out_dir, exist_ok=True)
+    links_path = os.path.join(out_dir, f"cdx_{slug}.txt")
+    records_path = os.path.join(out_dir, f"cdx_{slug}.jsonl")
+    state_path = os.path.join(out_dir, f"cdx_{slug}.state.json")
+
+    state = load_state(state_path) if resume else {}
+    resume_key = state.get("resume_key")
+    if resume:
+        # Records of a page that was cut short are on disk but not in the state file
+        last_timestamp = max(filter(None, [state.get("last_timestamp"), last_recorded_timestamp(records_path)]),
+                             default=None)
+    else:
+        last_timestamp = None
+        for path in (links_path, records_path):
+            open(path, "w").close()
+
+    # An interrupted listing carries on from its resume key; a finished one
+    # only asks for captures newer than the last timestamp already on disk.
+    from_ts = None if resume_key else last_timestamp
+
+    own_session = session is None
+    session = session or create_session(1)
+    written = 0
+    try:
+        with open(links_path, "a", encoding="utf-8") as links, open(records_path, "a", encoding="utf-8") as jsonl:
+            pages = iter_cdx_pages(session, url, endpoint=endpoint, collapse=collapse, from_ts=from_ts,
+                                   page_size=page_size, resume_key=resume_key, timeout=timeout)
+            for records, resume_key in pages:
+                for record in records:
+                    if last_timestamp and record["timestamp"] <= last_timestamp:
+                        continue
+                    links.write(archive_url(record, prefix) + "\n")
+                    jsonl.write(json.dumps(record) + "\n")
+                    last_timestamp = record["timestamp"]
+                    written += 1
+                links.flush()
+                jsonl.flush()
+                save_state(state_path, {"last_timestamp": last_timestamp, "resume_key": resume_key})
+    finally:
+        if own_session:
+            session.close()
+
+    return written, links_path, records_path
+
+def read_records(records_path):
+    with open(records_path, "r", encoding="utf-8") as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+def snapshot_date(record):
+    return datetime.strptime(record["timestamp"][:8], "%Y%m%d")
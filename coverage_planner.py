@@ -0,0 +1,158 @@
+import argparse
+import os
+import numpy as np
+import pandas as pd
+from cdx_client import archive_url, read_records
+from eci_dataset import load_eci_data
+from negative_cache import NEGATIVE_CACHE_PATH, NegativeCache
+from snapshot_table import SNAPSHOT_TIMESTAMP, extract_initiative_id
+
+# The CDX listing has hundreds of captures on busy days and none for weeks
+# at a time. This picks the fewest snapshots that give one capture per
+# day (or hour) the dataset does not cover yet, preferring the latest
+# capture of each bucket, and drops the pre-launch captures known to be empty.
+
+# Bucket key = prefix of the 14-digit Wayback timestamp
+BUCKET_WIDTHS = {"D": 8, "h": 10}
+BUCKET_FORMATS = {"D": "%Y%m%d", "h": "%Y%m%d%H"}
+
+def capture_timestamp(url):
+    match = SNAPSHOT_TIMESTAMP.search(url)
+    return match.group(1) if match else None
+
+def read_listing(path):
+    # cdx_<id>.jsonl from get_snapshot_urls.py, or any file of snapshot URLs
+    if path.endswith(".jsonl"):
+        return [archive_url(record) for record in read_records(path)]
+    with open(path, "r", encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip()]
+
+def read_url_file(path):
+    if not path or not os.path.exists(path):
+        return set()
+    with open(path, "r", encoding="utf-8") as f:
+        return {line.strip() for line in f if line.strip()}
+
+def covered_buckets(df, freq="D"):
+    # A bucket counts as covered once it holds every country the initiative reports
+    if df is None or df.empty:
+        return set()
+    buckets = df["capture_ts"].dt.strftime(BUCKET_FORMATS[freq]).rename("bucket")
+    countries = df.groupby([df["initiative_id"], buckets], observed=True)["Country"].nunique()
+    full = df.groupby("initiative_id", observed=True)["Country"].nunique()
+    needed = full.reindex(countries.index.get_level_values("initiative_id")).to_numpy()
+    return set(countries.index[countries.to_numpy() >= needed])
+
+def empty_until(df, nodata_urls):
+    # Per initiative: the newest no-data capture older than its first capture with data
+    first_data = {}
+    if df is not None and not df.empty:
+        first = df.groupby("initiative_id", observed=True)["capture_ts"].min()
+        first_data = {str(i): ts.strftime("%Y%m%d%H%M%S") for i, ts in first.items()}
+
+    cutoffs = {}
+    for url in nodata_urls:
+        initiative_id, ts = extract_initiative_id(url), capture_timestamp(url)
+        if ts is None or initiative_id not in first_data or ts >= first_data[initiative_id]:
+            continue
+        cutoffs[initiative_id] = max(ts, cutoffs.get(initiative_id, ts))
+    return cutoffs
+
+def gap_sizes(buckets, covered, freq="D"):
+    # Distance (in buckets) from each candidate to the nearest bucket that already has data
+    fmt, step = BUCKET_FORMATS[freq], pd.Timedelta(1, unit="D" if freq == "D" else "h")
+    when = pd.to_datetime([bucket for _, bucket in buckets], format=fmt)
+    sizes = np.full(len(buckets), np.inf)
+    by_initiative = {}
+    for initiative_id, bucket in covered:
+        by_initiative.setdefault(initiative_id, []).append(bucket)
+
+    for initiative_id, have in by_initiative.items():
+        mask = np.array([i == initiative_id for i, _ in buckets], dtype=bool)
+        if not mask.any():
+            continue
+        have = np.sort(pd.to_datetime(have, format=fmt).to_numpy())
+        points = when[mask].to_numpy()
+        pos = np.searchsorted(have, points)
+        before = np.abs(points - have[np.clip(pos - 1, 0, len(have) - 1)])
+        after = np.abs(have[np.clip(pos, 0, len(have) - 1)] - points)
+        sizes[mask] = np.minimum(before, after) / step.to_timedelta64()
+    return sizes
+
+def plan_coverage(urls, df=None, nodata_urls=(), freq="D", budget=None):
+    width = BUCKET_WIDTHS[freq]
+    covered = covered_buckets(df, freq)
+    cutoffs = empty_until(df, nodata_urls)
+    nodata_urls = set(nodata_urls)
+
+    stats = {"listed": len(urls), "covered": 0, "known_empty": 0, "redundant": 0}
+    latest = {}
+    for url in urls:
+        ts = capture_timestamp(url)
+        if ts is None:
+            continue
+        initiative_id = extract_initiative_id(url)
+        bucket = (initiative_id, ts[:width])
+        if url in nodata_urls or ts <= cutoffs.get(initiative_id, ""):
+            stats["known_empty"] += 1
+        elif bucket in covered:
+            stats["covered"] += 1
+        elif bucket not in latest or ts > latest[bucket][0]:
+            if bucket in latest:
+                stats["redundant"] += 1
+            latest[bucket] = (ts, url)
+        else:
+            stats["redundant"] += 1
+
+    buckets = list(latest)
+    if budget is not None and len(buckets) > budget:
+        # Greedy: always take the candidate farthest from any data, counting earlier picks
+        # as data, so the budget is spread over every hole instead of one
+        candidates, buckets, have = buckets, [], set(covered)
+        while len(buckets) < budget:
+            pick = candidates.pop(int(np.argmax(gap_sizes(candidates, have, freq))))
+            buckets.append(pick)
+            have.add(pick)
+    stats["over_budget"] = len(latest) - len(buckets)
+
+    plan = sorted((latest[bucket] for bucket in buckets), key=lambda item: item[0])
+    return [url for _, url in plan], stats
+
+def add_plan_arguments(parser):
+    parser.add_argument("listing", help="cdx_<id>.jsonl or a file of snapshot URLs (e.g. the full CDX listing)")
+    parser.add_argument("--output", default="input_urls.txt")
+    parser.add_argument("--freq", choices=list(BUCKET_WIDTHS), default="D",
+                        help="Target resolution: one capture per day (D) or hour (h)")
+    parser.add_argument("--nodata", default="nodata_urls.txt", help="Snapshots already known to have no table")
+    parser.add_argument("--negative-cache", default=NEGATIVE_CACHE_PATH,
+                        help="No-data cache written by get_snapshot_data.py; its snapshots count as known empty")
+    parser.add_argument("--budget", type=int, help="At most this many snapshots, widest gaps first")
+    parser.add_argument("--all", action="store_true", help="Ignore what the dataset already covers")
+    return parser
+
+def main(args):
+    urls = read_listing(args.listing)
+    df = None if args.all else load_eci_data(initiative_id=None, columns=["initiative_id", "Country", "capture_ts"])
+    nodata_urls = read_url_file(args.nodata)
+    if os.path.exists(args.negative_cache):
+        negative_cache = NegativeCache(args.negative_cache)
+        nodata_urls |= set(negative_cache.known_empty(urls))
+        negative_cache.close()
+    plan, stats = plan_coverage(urls, df, nodata_urls, args.freq, args.budget)
+
+    tmp_path = f"{args.output}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        for url in plan:
+            f.write(url + "\n")
+    os.replace(tmp_path, args.output)
+
+    print(f"🗓️  {stats['listed']} captures -> {len(plan)} to scrape "
+          f"({stats['covered']} already covered, {stats['known_empty']} known empty, "
+          f"{stats['redundant']} redundant, {stats['over_budget']} over budget)")
+    print(f"📁 Saved to {args.output}")
+    return plan
+
+if __name__ == "__main__":
+    parser = add_plan_arguments(argparse.ArgumentParser(
+        description="Pick the fewest snapshots that fill the gaps in the dataset at a target resolution."))
+    main(parser.parse_args())
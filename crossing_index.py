@@ -0,0 +1,93 @@
+import argparse
+import os
+import pandas as pd
+from eci_dataset import BASE_DIR, dataset_mtime, load_eci_data, normalize
+
+# Per initiative and country: the first capture where support exceeded the
+# threshold, plus the capture just before it. Ranking reads this small
+# table instead of rescanning every row.
+
+INDEX_PATH = os.path.join(BASE_DIR, "CSVs", "threshold_crossings.csv")
+KEY = ["initiative_id", "Country"]
+INDEX_COLUMNS = KEY + ["first_crossed_ts", "support_at_crossing", "threshold", "previous_capture_ts"]
+TOTAL_ROW = "Total number of signatories"
+
+def _crossing_candidates(df):
+    df = df[df["Country"] != TOTAL_ROW]
+    df = df.astype({"initiative_id": str, "Country": str})
+    crossed = df[df["Statements of Support"] > df["Threshold"]]
+
+    first = (
+        crossed.sort_values("capture_ts")
+        .drop_duplicates(subset=KEY, keep="first")
+        .rename(columns={"capture_ts": "first_crossed_ts", "Statements of Support": "support_at_crossing",
+                         "Threshold": "threshold"})
+        [KEY + ["first_crossed_ts", "support_at_crossing", "threshold"]]
+    )
+    latest_seen = df.groupby(KEY)["capture_ts"].max().rename("latest_seen_ts").reset_index()
+    return df[KEY + ["capture_ts"]], first, latest_seen
+
+def _previous_captures(captures, first):
+    # Latest capture strictly before the first crossing (or the latest overall if never crossed)
+    merged = captures.merge(first[KEY + ["first_crossed_ts"]], on=KEY, how="left")
+    before = merged[merged["first_crossed_ts"].isna() | (merged["capture_ts"] < merged["first_crossed_ts"])]
+    return before.groupby(KEY)["capture_ts"].max().rename("previous_capture_ts").reset_index()
+
+def build_crossing_index(df):
+    captures, first, latest_seen = _crossing_candidates(normalize(df) if "capture_ts" not in df else df)
+    index = latest_seen[KEY].merge(first, on=KEY, how="left")
+    index = index.merge(_previous_captures(captures, first), on=KEY, how="left")
+    return index[INDEX_COLUMNS].sort_values("first_crossed_ts", na_position="last").reset_index(drop=True)
+
+def update_crossing_index(index, new_rows):
+    if index is None or index.empty:
+        return build_crossing_index(new_rows)
+
+    captures, new_first, _ = _crossing_candidates(normalize(new_rows) if "capture_ts" not in new_rows else new_rows)
+
+    combined = pd.concat([
+        index[KEY + ["first_crossed_ts", "support_at_crossing", "threshold"]].dropna(subset=["first_crossed_ts"]),
+        new_first,
+    ])
+    first = combined.sort_values("first_crossed_ts").drop_duplicates(subset=KEY, keep="first")
+
+    # Previous capture: the best of what the index already knew and what the new rows add
+    known = index[KEY + ["previous_capture_ts"]].rename(columns={"previous_capture_ts": "capture_ts"}).dropna()
+    previous = _previous_captures(pd.concat([known, captures], ignore_index=True), first)
+
+    keys = pd.concat([index[KEY], captures[KEY]]).drop_duplicates()
+    updated = keys.merge(first, on=KEY, how="left").merge(previous, on=KEY, how="left")
+    return updated[INDEX_COLUMNS].sort_values("first_crossed_ts", na_position="last").reset_index(drop=True)
+
+def load_crossing_index(path=INDEX_PATH):
+    if not os.path.exists(path):
+        return None
+    return pd.read_csv(path, parse_dates=["first_crossed_ts", "previous_capture_ts"])
+
+def open_crossing_index(path=INDEX_PATH):
+    # Rebuilt from the dataset when missing or older than the dataset, so new crossings are never missed
+    if os.path.exists(path) and os.path.getmtime(path) >= dataset_mtime():
+        return load_crossing_index(path)
+    index = build_crossing_index(load_eci_data(initiative_id=None))
+    save_crossing_index(index, path)
+    return index
+
+def save_crossing_index(index, path=INDEX_PATH):
+    tmp_path = f"{path}.tmp"
+    index.to_csv(tmp_path, index=False)
+    os.replace(tmp_path, path)
+
+def ingest(new_rows, path=INDEX_PATH):
+    # Seeded from the full dataset first; an index built from one chunk would date every crossing to it
+    index = update_crossing_index(open_crossing_index(path), new_rows)
+    save_crossing_index(index, path)
+    return index
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rebuild the threshold first-crossing index from the full dataset.")
+    parser.add_argument("--path", default=INDEX_PATH)
+    args = parser.parse_args()
+
+    index = build_crossing_index(load_eci_data(initiative_id=None))
+    save_crossing_index(index, args.path)
+    print(f"📦 {index['first_crossed_ts'].notna().sum()} of {len(index)} countries have crossed; saved to {args.path}")
@@ -0,0 +1,163 @@
+import os
+import sys
+import threading
+import time
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
+
+# "lean" rendering: only the DOM matters for reading the table, so skip
+# everything that is fetched purely for looks, the Wayback toolbar and
+# analytics. wombat.js is left alone because archived pages need it.
+RENDER_PROFILES = ("full", "lean")
+LEAN_BLOCKED_URLS = [
+    "*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.svg*", "*.webp*", "*.ico*",
+    "*.woff*", "*.ttf*", "*.otf*", "*.eot*",
+    "*.css*",
+    "*/_static/js/bundle-playback.js*", "*/_static/js/ruffle*", "*/_static/css/*", "*/_static/images/*",
+    "*archive.org/includes/analytics.js*",
+    "*google-analytics.com*", "*googletagmanager.com*", "*webtools.europa.eu*", "*matomo*", "*piwik*",
+]
+
+def build_chrome_options(profile="full"):
+    options = Options()
+    options.add_argument("--headless=new")
+    options.add_argument("--disable-gpu")
+    options.add_argument("--log-level=3")
+    options.add_experimental_option('excludeSwitches', ['enable-logging'])
+    options.add_argument('--disable-logging')
+    options.add_argument('--disable-dev-shm-usage')
+    options.add_argument('--no-sandbox')
+    options.add_argument("--disable-software-rasterizer")
+    options.add_argument("--disable-features=VoiceAudioCapture,VoiceDetection,AudioServiceAudioStreams")
+    options.add_argument("--enable-unsafe-swiftshader")
+    if profile == "lean":
+        # Hand control back once the DOM is parsed instead of after every subresource
+        options.page_load_strategy = "eager"
+        options.add_argument("--blink-settings=imagesEnabled=false")
+        options.add_argument("--disable-remote-fonts")
+        options.add_argument("--disable-extensions")
+        options.add_argument("--mute-audio")
+    return options
+
+def launch_driver(page_load_timeout=20, profile="full"):
+    os.environ['GOOGLE_API_CPP_LOG_LEVEL'] = '3'
+    os.environ['CHROME_LOG_FILE'] = os.devnull
+
+    options = build_chrome_options(profile)
+    service = Service(log_path=os.devnull)
+
+    # Silence native ChromeDriver stderr messages
+    old_stderr = sys.stderr
+    sys.stderr = open(os.devnull, 'w')
+
+    try:
+        driver = webdriver.Chrome(service=service, options=options)
+    finally:
+        sys.stderr.close()
+        sys.stderr = old_stderr
+
+    driver.set_page_load_timeout(page_load_timeout)
+    if profile == "lean":
+        driver.execute_cdp_cmd("Network.enable", {})
+        driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": LEAN_BLOCKED_URLS})
+    return driver
+
+def driver_is_healthy(driver):
+    try:
+        driver.execute_script("return 1")
+        return True
+    except Exception:
+        return False
+
+class DriverPool:
+    # One long-lived driver per worker thread, recycled after max_pages
+    # pages or as soon as it stops answering.
+    def __init__(self, size, max_pages=50, page_load_timeout=20, profile="full"):
+        self.size = size
+        self.max_pages = max_pages
+        self.page_load_timeout = page_load_timeout
+        self.profile = profile
+
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._live = set()
+
+        self.launches = 0
+        self.recycles = 0
+        self.crashes = 0
+        self.startup_times = []
+        self.teardown_times = []
+
+    def _launch(self):
+        start = time.time()
+        driver = launch_driver(self.page_load_timeout, self.profile)
+        elapsed = time.time() - start
+        with self._lock:
+            self._live.add(driver)
+            self.launches += 1
+            self.startup_times.append(elapsed)
+        self._local.driver = driver
+        self._local.pages = 0
+        return driver
+
+    def _teardown(self, driver):
+        start = time.time()
+        try:
+            driver.quit()
+        except Exception:
+            pass
+        elapsed = time.time() - start
+        with self._lock:
+            self._live.discard(driver)
+            self.teardown_times.append(elapsed)
+
+    def _drop_current(self):
+        driver = getattr(self._local, "driver", None)
+        self._local.driver = None
+        self._local.pages = 0
+        if driver is not None:
+            self._teardown(driver)
+
+    def acquire(self):
+        driver = getattr(self._local, "driver", None)
+        if driver is None:
+            return self._launch()
+
+        if self._local.pages >= self.max_pages:
+            with self._lock:
+                self.recycles += 1
+            self._drop_current()
+            return self._launch()
+
+        return driver
+
+    def release(self, driver, failed=False):
+        if failed and not driver_is_healthy(driver):
+            with self._lock:
+                self.crashes += 1
+            self._drop_current()
+            return
+        self._local.pages += 1
+
+    def shutdown(self):
+        with self._lock:
+            drivers = list(self._live)
+        for driver in drivers:
+            self._teardown(driver)
+
+    def stats(self):
+        with self._lock:
+            startup = list(self.startup_times)
+            teardown = list(self.teardown_times)
+            return {
+                "pool_size": self.size,
+                "profile": self.profile,
+                "max_pages": self.max_pages,
+                "launches": self.launches,
+                "recycles": self.recycles,
+                "crashes": self.crashes,
+                "startup_total": sum(startup),
+                "startup_avg": sum(startup) / len(startup) if startup else 0.0,
+                "teardown_total": sum(teardown),
+            }
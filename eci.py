@@ -0,0 +1,64 @@
+import argparse
+import os
+import sys
+import pandas as pd
+import coverage_planner
+import get_snapshot_data
+import get_snapshot_urls
+from eci_dataset import DEFAULT_INITIATIVE
+
+# One entry point for the whole pipeline:
+#   python eci.py list    --initiative 2024/000007
+#   python eci.py plan    "Snapshot Links/cdx_2024_000007.jsonl" --freq D
+#   python eci.py scrape  --engine http --workers 8 --timeout 30
+#   python eci.py analyze --initiative 2024/000007 --charts
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BASE_DIR, "My Analyses"))
+
+def run_analyze(args):
+    # Imported here so list/scrape never pay for matplotlib
+    from eci_analysis import CAMPAIGN_END_DATE, print_status
+    from render_reports import DEFAULT_OUTPUT_DIR, load_analyses, render_reports
+
+    end_date = pd.to_datetime(args.campaign_end) if args.campaign_end else CAMPAIGN_END_DATE
+    analyses = load_analyses(None if args.initiative == "all" else args.initiative, end_date)
+
+    for initiative_id, analysis in analyses.items():
+        print(f"\n=== {initiative_id} ===")
+        print_status(analysis)
+
+    if args.charts:
+        render_reports(analyses, args.out or DEFAULT_OUTPUT_DIR, args.formats, args.workers, args.force)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="List, scrape and analyse ECI signature snapshots.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    list_parser = get_snapshot_urls.add_list_arguments(
+        subparsers.add_parser("list", help="List Wayback snapshots via the CDX API"))
+
+    plan_parser = coverage_planner.add_plan_arguments(
+        subparsers.add_parser("plan", help="Pick the snapshots that fill gaps in the dataset"))
+
+    scrape_parser = get_snapshot_data.add_scrape_arguments(
+        subparsers.add_parser("scrape", help="Scrape country tables from listed snapshots"))
+
+    analyze_parser = subparsers.add_parser("analyze", help="Summarise progress and render projection charts")
+    analyze_parser.add_argument("--initiative", default=DEFAULT_INITIATIVE, help="Initiative ID, or 'all'")
+    analyze_parser.add_argument("--campaign-end", help="Collection deadline, e.g. 2025-07-31")
+    analyze_parser.add_argument("--charts", action="store_true", help="Also render every country's chart")
+    analyze_parser.add_argument("--out", help="Chart output folder (default: My Analyses/Reports)")
+    analyze_parser.add_argument("--formats", nargs="+", default=["png"], choices=["png", "svg", "pdf"])
+    analyze_parser.add_argument("--workers", type=int, default=os.cpu_count())
+    analyze_parser.add_argument("--force", action="store_true", help="Re-render even if inputs are unchanged")
+
+    args = parser.parse_args()
+    if args.command == "list":
+        get_snapshot_urls.main(args)
+    elif args.command == "plan":
+        coverage_planner.main(args)
+    elif args.command == "scrape":
+        get_snapshot_data.main(args, scrape_parser)
+    else:
+        run_analyze(args)
@@ -0,0 +1,102 @@
+import argparse
+import os
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from snapshot_table import add_initiative_id
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DATASET_DIR = os.path.join(BASE_DIR, "Dataset")
+DEFAULT_CSV = os.path.join(BASE_DIR, "CSVs", "eci_2024-07-31_to_2025-07-14.csv")
+DEFAULT_INITIATIVE = "2024/000007"
+PARTITION_COLS = ["initiative_id", "capture_month"]
+
+def normalize(df):
+    df = add_initiative_id(df.copy()) if "snapshot_url" in df.columns else df.copy()
+    # Older CSVs predate snapshot_url and only ever covered one initiative
+    df["initiative_id"] = df.get("initiative_id", pd.Series(index=df.index, dtype=object)).fillna(DEFAULT_INITIATIVE)
+
+    df["capture_date"] = pd.to_datetime(df["capture_date"], errors="coerce")
+    # Prefer the Wayback timestamp; some older rows have mangled GMT_capture_time values
+    from_time = pd.to_datetime(
+        df["capture_date"].dt.strftime("%Y-%m-%d") + " " + df["GMT_capture_time"].astype(str).str.replace("-", ":"),
+        format="%Y-%m-%d %H:%M:%S", errors="coerce",
+    )
+    if "snapshot_url" in df.columns:
+        from_url = pd.to_datetime(df["snapshot_url"].str.extract(r'/web/(\d{14})', expand=False),
+                                  format="%Y%m%d%H%M%S", errors="coerce")
+        from_time = from_url.fillna(from_time)
+    df["capture_ts"] = from_time.fillna(df["capture_date"])
+    df["capture_month"] = df["capture_date"].dt.strftime("%Y-%m")
+
+    # Older files carry counts as floats (13395.0)
+    for column in ("Statements of Support", "Threshold"):
+        df[column] = pd.to_numeric(df[column], errors="coerce").round().astype("Int64")
+    df["Percentage"] = pd.to_numeric(df["Percentage"], errors="coerce")
+    df["Country"] = df["Country"].astype("category")
+    return df
+
+def write_dataset(df, root=DATASET_DIR):
+    # Only the (initiative, month) partitions present in df are rewritten,
+    # so df must hold the full contents of every partition it touches.
+    df = normalize(df)
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    pq.write_to_dataset(table, root, partition_cols=PARTITION_COLS,
+                        existing_data_behavior="delete_matching")
+    return df
+
+def append_to_dataset(new_df, root=DATASET_DIR):
+    new_df = normalize(new_df)
+    frames = [new_df]
+
+    # Pull in what the touched partitions already hold, so rewriting them keeps older rows
+    if os.path.isdir(root):
+        filters = [
+            ("initiative_id", "in", list(new_df["initiative_id"].unique())),
+            ("capture_month", "in", list(new_df["capture_month"].unique())),
+        ]
+        existing = pq.read_table(root, filters=filters).to_pandas()
+        frames.insert(0, existing)
+
+    combined = pd.concat([df.astype({col: str for col in PARTITION_COLS}) for df in frames], ignore_index=True)
+    combined = combined.drop_duplicates(subset=["initiative_id", "capture_ts", "Country"], keep="last")
+    return write_dataset(combined, root)
+
+def dataset_mtime(csv_path=DEFAULT_CSV, root=DATASET_DIR):
+    # When the data load_eci_data reads last changed, so derived stores can tell they are stale
+    if os.path.isdir(root):
+        return max(os.path.getmtime(os.path.join(d, name))
+                   for d, dirs, files in os.walk(root) for name in [".", *files])
+    return os.path.getmtime(csv_path) if os.path.exists(csv_path) else 0.0
+
+def load_eci_data(csv_path=DEFAULT_CSV, initiative_id=DEFAULT_INITIATIVE, columns=None, root=DATASET_DIR):
+    if os.path.isdir(root):
+        if os.path.exists(csv_path) and os.path.getmtime(csv_path) > dataset_mtime(csv_path, root):
+            print(f"⚠️  '{csv_path}' is newer than the Parquet dataset in '{root}'; "
+                  f"run eci_dataset.py {csv_path} --root {root} to bring it up to date")
+        filters = [("initiative_id", "=", initiative_id)] if initiative_id else None
+        df = pq.read_table(root, columns=columns, filters=filters, memory_map=True).to_pandas()
+    else:
+        df = normalize(pd.read_csv(csv_path))
+        if initiative_id:
+            df = df[df["initiative_id"] == initiative_id]
+        if columns:
+            df = df[columns]
+
+    if "capture_ts" in df.columns:
+        df = df.sort_values("capture_ts", kind="stable")
+    return df.reset_index(drop=True)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Convert scraped CSVs into the partitioned Parquet dataset.")
+    parser.add_argument("csvs", nargs="*", default=[DEFAULT_CSV])
+    parser.add_argument("--root", default=DATASET_DIR)
+    args = parser.parse_args()
+
+    frames = [pd.read_csv(path) for path in args.csvs]
+    combined = pd.concat(frames, ignore_index=True)
+    combined = combined.drop_duplicates(subset=["capture_date", "GMT_capture_time", "Country"], keep="last")
+    df = write_dataset(combined, args.root)
+
+    print(f"📦 Wrote {len(df)} rows to '{args.root}' "
+          f"({df['initiative_id'].nunique()} initiatives, {df['capture_month'].nunique()} months)")
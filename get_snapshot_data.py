@@ -1,114 +1,120 @@
+import argparse
 import os
-import re
 import time
-from datetime import datetime
 import pandas as pd
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from selenium import webdriver
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.service import Service
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
-import sys
-
-def extract_capture_date(url):
-    match = re.search(r'/web/(\d{14})/', url)
-    if match:
-        timestamp = match.group(1)
-        dt = datetime.strptime(timestamp, "%Y%m%d%H%M%S")
-        return dt.strftime("%Y-%m-%d"), dt.strftime("%H:%M:%S")
-    return "unknown_date", "unknown_time"
-
-def scrape_and_save(url):
-    os.environ['GOOGLE_API_CPP_LOG_LEVEL'] = '3'
-    os.environ['CHROME_LOG_FILE'] = os.devnull
-
-    options = Options()
-    options.add_argument("--headless=new")
-    options.add_argument("--disable-gpu")
-    options.add_argument("--log-level=3")
-    options.add_experimental_option('excludeSwitches', ['enable-logging'])
-    options.add_argument('--disable-logging')
-    options.add_argument('--disable-dev-shm-usage')
-    options.add_argument('--no-sandbox')
-    options.add_argument("--disable-software-rasterizer")
-    options.add_argument("--disable-features=VoiceAudioCapture,VoiceDetection,AudioServiceAudioStreams")
-    options.add_argument("--enable-unsafe-swiftshader")
-
-    service = Service(log_path=os.devnull)
-
-    old_stderr = sys.stderr
-    sys.stderr = open(os.devnull, 'w')
-
-    try:
-        driver = webdriver.Chrome(service=service, options=options)
-    finally:
-        sys.stderr.close()
-        sys.stderr = old_stderr
+from crossing_index import ingest
+from timeseries_store import ingest as ingest_timeseries
+from driver_pool import RENDER_PROFILES, DriverPool, launch_driver
+from eci_dataset import DATASET_DIR, DEFAULT_CSV, append_to_dataset
+from async_engine import save_all_async
+from http_engine import create_session, scrape_with_http
+from master_dataset import TEXT_CSV, load_master, range_filename, save_scrape_results, scraped_urls, write_parquet_atomic
+from page_cache import PageCache
+from page_classifier import PAGE_PREFIX_SCRIPT, PREFIX_CHARS, classify_page
+from retry_scheduler import RetryPolicy, RetryScheduler
+from row_writer import STAGING_PATH, RowWriter
+from scrape_journal import JOURNAL_PATH, ScrapeJournal
+from scrape_metrics import ScrapeMetrics, timed
+from snapshot_dedup import expand_duplicates, load_groups
+from negative_cache import NEGATIVE_CACHE_PATH, NegativeCache, skip_known_empty
+from snapshot_table import extract_initiative_id, no_data, parse_table_rows, rows_to_snapshot_df
+
+OUTPUT_CHUNK_ROWS = 50_000
+
+# Reads every row's <td> text in one WebDriver call instead of one
+# find_elements plus four .text calls per row
+TABLE_ROWS_SCRIPT = """
+const rows = Array.from(document.querySelectorAll("table tr"),
+                        tr => Array.from(tr.querySelectorAll("td"), td => td.innerText));
+return [rows, arguments[0] ? document.documentElement.outerHTML : null];
+"""
+
+def read_table_rows(driver, with_html=False):
+    rows, html = driver.execute_script(TABLE_ROWS_SCRIPT, with_html)
+    return rows, html
+
+def scrape_and_save(url, pool=None, cache=None, info=None, table_timeout=10):
+    driver = None
+
+    def done(failed=False):
+        if driver is None:
+            return
+        if pool is not None:
+            pool.release(driver, failed=failed)
+        else:
+            try:
+                driver.quit()
+            except:
+                pass
 
     try:
-        driver.set_page_load_timeout(20)
-        driver.get(url)
+        # A browser that fails to start is an exception for this URL, not for the whole run
+        with timed(info, "driver"):
+            driver = pool.acquire() if pool is not None else launch_driver()
+
+        with timed(info, "navigate"):
+            driver.get(url)
+
+        # Error pages, redirect stubs and captchas are recognised before waiting for the table
+        with timed(info, "classify"):
+            final_url, prefix = driver.execute_script(PAGE_PREFIX_SCRIPT, PREFIX_CHARS)
+            verdict = classify_page(url, final_url, prefix)
+        if verdict is not None:
+            done()
+            status, reason = verdict
+            print(f"⛔ Aborted ({reason}): {url}")
+            if info is not None:
+                info["reason"] = reason
+            return None, status
 
         try:
-            WebDriverWait(driver, 10).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "table tr"))
-            )
+            with timed(info, "wait"):
+                WebDriverWait(driver, table_timeout).until(
+                    EC.presence_of_element_located((By.CSS_SELECTOR, "table tr"))
+                )
         except:
-            driver.quit()
+            done()
             print(f"⚠️  Skipped (no table found on page): {url}")
-            return None, "no_data"
-
-        rows = driver.find_elements(By.CSS_SELECTOR, "table tr")
-        if len(rows) <= 1:
-            driver.quit()
-            print(f"⚠️  Skipped (table had only headers or was empty): {url}")
-            return None, "no_data"
-
-        data = []
-        capture_date, capture_time = extract_capture_date(url)
-        for row in rows[1:]:
-            cols = row.find_elements(By.TAG_NAME, "td")
-            if len(cols) != 4:
-                continue
-            data.append({
-                "capture_date": capture_date,
-                "GMT_capture_time": capture_time,
-                "Country": cols[0].text.strip(),
-                "Statements of Support": cols[1].text.strip().replace(',', ''),
-                "Threshold": cols[2].text.strip().replace(',', ''),
-                "Percentage": cols[3].text.strip().replace('%', ''),
-                "snapshot_url": url,
-            })
-
-        driver.quit()
-
-        if not data:
-            print(f"⚠️  Skipped (rows found but no valid data): {url}")
-            return None, "no_data"
-
-        df = pd.DataFrame(data)
-        return df, "success"
+            return no_data(info, "no_table")
+
+        with timed(info, "extract"):
+            rows, html = read_table_rows(driver, with_html=cache is not None)
+        if cache is not None:
+            cache.put(url, html)
+        done()
+
+        with timed(info, "build"):
+            return rows_to_snapshot_df(url, rows, info)
     except Exception as e:
-        try:
-            driver.quit()
-        except:
-            pass
+        done(failed=True)
         print(f"❌ Exception for URL {url}: {e}")
         return None, "exception"
 
-def scrape_and_save_with_retry(url, retries=3, base_delay=60):
-    for attempt in range(1, retries + 1):
-        df, status = scrape_and_save(url)
-        if status in ("success", "no_data"):
-            return df, status
-        delay = base_delay * (2 ** (attempt - 1))
-        print(f"🔁 Retry {attempt}/{retries} for {url} in {delay}s...")
-        time.sleep(delay)
-    return None, "exception"
-
-def print_summary(success_log, nodata_log, exception_log, duration_seconds):
+def scrape_url(url, engine="selenium", pool=None, session=None, cache=None, info=None, raw=False,
+               timeout=20, table_timeout=10):
+    if engine in ("http", "async"):
+        return scrape_with_http(url, session, timeout=timeout, cache=cache, info=info, raw=raw,
+                                fallback=lambda u: scrape_and_save(u, pool=pool, cache=cache, info=info,
+                                                                   table_timeout=table_timeout))
+
+    if cache is not None:
+        with timed(info, "cache"):
+            html = cache.get(url)
+            rows = parse_table_rows(html) if html is not None else None
+        if rows:
+            with timed(info, "build"):
+                return rows_to_snapshot_df(url, rows, info)
+    return scrape_and_save(url, pool=pool, cache=cache, info=info, table_timeout=table_timeout)
+
+def timed_scrape_url(url, info=None, **kwargs):
+    with timed(info, "total"):
+        return scrape_url(url, info=info, **kwargs)
+
+def print_summary(success_log, nodata_log, exception_log, duration_seconds, pool_stats=None, cache_stats=None):
     duration_minutes = duration_seconds / 60
     print("\n" + "=" * 60)
     print("📋 Scrape Summary")
@@ -125,7 +131,24 @@ def print_summary(success_log, nodata_log, exception_log, duration_seconds):
     print(f"❌   Exception Count: {len(exception_log)}")
     print(f"\n⏱️  Total scraping duration: {duration_seconds:.2f} seconds | {duration_minutes:.2f} mins\n")
 
-def save_all_with_threads(url_list, max_threads=2, retries=3, append_df=None):
+    if pool_stats:
+        print(f"🚗 Driver pool: {pool_stats['pool_size']} workers | recycle after {pool_stats['max_pages']} pages | "
+              f"{pool_stats['profile']} render profile")
+        print(f"   Launches: {pool_stats['launches']} | Recycles: {pool_stats['recycles']} | Crashes: {pool_stats['crashes']}")
+        print(f"   Startup: {pool_stats['startup_total']:.2f}s total ({pool_stats['startup_avg']:.2f}s avg) | "
+              f"Teardown: {pool_stats['teardown_total']:.2f}s total\n")
+
+    if cache_stats:
+        lookups = cache_stats['hits'] + cache_stats['misses']
+        hit_rate = cache_stats['hits'] / lookups * 100 if lookups else 0.0
+        print(f"🗄️  Page cache: {cache_stats['hits']} hits | {cache_stats['misses']} misses ({hit_rate:.1f}% hit rate)")
+        print(f"   Writes: {cache_stats['writes']} | Evictions: {cache_stats['evictions']} | "
+              f"Size: {cache_stats['size_mb']:.1f}/{cache_stats['max_mb']:.0f} MB\n")
+
+def save_all_with_threads(url_list, max_threads=2, retries=3, append_df=None, max_pages_per_driver=50,
+                          engine="selenium", cache=None, writer=None, journal=None, base_delay=60,
+                          metrics=None, render_profile="full", raw=False, timeout=20, table_timeout=10,
+                          negative_cache=None):
     all_dfs = [] if append_df is None else [append_df]
     exception_urls = []
     nodata_urls = []
@@ -134,136 +157,304 @@ def save_all_with_threads(url_list, max_threads=2, retries=3, append_df=None):
     exception_log = []
     nodata_log = []
 
-    with ThreadPoolExecutor(max_workers=max_threads) as executor:
-        futures = {executor.submit(scrape_and_save_with_retry, url, retries=retries): url for url in url_list}
-        for future in as_completed(futures):
-            url = futures[future]
-            df, status = future.result()
+    # With the http engine the drivers are only launched for fallback pages
+    pool = DriverPool(max_threads, max_pages=max_pages_per_driver, page_load_timeout=timeout, profile=render_profile)
+    session = create_session(max_threads) if engine == "http" else None
 
-            if status == "success":
-                all_dfs.append(df)
-                success_log.append(f"✅ Success: {url}")
-            elif status == "no_data":
-                nodata_urls.append(url)
-                nodata_log.append(f"⚠️  No valid data found for: {url}")
-            elif status == "exception":
-                exception_urls.append(url)
-                exception_log.append(f"❌ Exception occurred while scraping: {url}")
+    scheduler = RetryScheduler(url_list, retries=retries, policy=RetryPolicy(base_delay))
+    in_flight = {}
+
+    with ThreadPoolExecutor(max_workers=max_threads) as executor:
+        while scheduler.pending() or in_flight:
+            # Keep every worker busy; URLs backing off stay queued, not asleep in a thread
+            while len(in_flight) < max_threads:
+                url = scheduler.next_ready()
+                if url is None:
+                    break
+                info = {}
+                future = executor.submit(timed_scrape_url, url, engine=engine, pool=pool, session=session,
+                                         cache=cache, info=info, raw=raw, timeout=timeout,
+                                         table_timeout=table_timeout)
+                in_flight[future] = (url, info)
+
+            wait_timeout = None if len(in_flight) >= max_threads else scheduler.next_delay()
+            if not in_flight:
+                time.sleep(wait_timeout or 0)
+                continue
+            done, _ = wait(in_flight, timeout=wait_timeout, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                url, info = in_flight.pop(future)
+                df, status = future.result()
+                delay = scheduler.complete(url, status, retry_after=info.get("retry_after"))
+                if metrics is not None:
+                    metrics.observe(info, status, final=delay is None)
+                if delay is not None:
+                    print(f"🔁 Retry {scheduler.attempts[url]}/{retries} for {url} in {delay:.0f}s...")
+                    continue
+
+                if status == "success":
+                    if writer is not None:
+                        writer.write(df)
+                    else:
+                        all_dfs.append(df)
+                    success_log.append(f"✅ Success: {url}")
+                elif status == "no_data":
+                    nodata_urls.append(url)
+                    nodata_log.append(f"⚠️  No valid data found for: {url} ({info.get('reason', 'no_table')})")
+                    if negative_cache is not None:
+                        negative_cache.record(url, info.get("reason"))
+                elif status == "exception":
+                    exception_urls.append(url)
+                    reason = f" ({info['reason']})" if info.get("reason") else ""
+                    exception_log.append(f"❌ Exception occurred while scraping: {url}{reason}")
+
+                # Only after the rows are on disk, so a crash can never mark unsaved work as done
+                if journal is not None:
+                    journal.record(url, status, attempts=scheduler.attempts[url])
+
+    if scheduler.retried or scheduler.breaker.trips:
+        print(f"🔁 {scheduler.retried} retries scheduled | circuit breaker tripped {scheduler.breaker.trips} times")
+
+    pool.shutdown()
+    pool_stats = pool.stats()
+    if session is not None:
+        session.close()
 
     if all_dfs:
         merged = pd.concat(all_dfs, ignore_index=True)
     else:
         merged = None
 
-    return merged, exception_urls, nodata_urls, success_log, exception_log, nodata_log
-
-def clear_log_files():
-    open("nodata_urls.txt", "w").close()
-    open("exception_urls.txt", "w").close()
-
-if __name__ == "__main__":
-    clear_log_files()
-
-    with open("input_urls.txt", "r") as file:
-        eci_urls = [line.strip() for line in file if line.strip()]
-
-    print("➡️  Starting initial scrape pass...")
-    start_time = time.time()
-    master_df, exceptions, nodata, success_log, exception_log, nodata_log = save_all_with_threads(
-        eci_urls, max_threads=4, retries=3
+    return merged, exception_urls, nodata_urls, success_log, exception_log, nodata_log, pool_stats
+
+def run_scrape(url_list, engine="selenium", max_threads=4, concurrency=32, retries=3, cache=None, writer=None,
+               journal=None, metrics=None, render_profile="full", raw=False, timeout=20, table_timeout=10,
+               negative_cache=None, rate=5.0, burst=10):
+    if engine != "async":
+        return save_all_with_threads(url_list, max_threads=max_threads, retries=retries, engine=engine,
+                                     cache=cache, writer=writer, journal=journal, metrics=metrics,
+                                     render_profile=render_profile, raw=raw, timeout=timeout,
+                                     table_timeout=table_timeout, negative_cache=negative_cache)
+
+    fallback_pool = DriverPool(2, page_load_timeout=timeout, profile=render_profile)
+    results = save_all_async(
+        url_list, concurrency=concurrency, rate=rate, burst=burst, retries=retries, cache=cache,
+        fallback=lambda u, info=None: scrape_and_save(u, pool=fallback_pool, cache=cache, info=info,
+                                                      table_timeout=table_timeout),
+        fallback_workers=fallback_pool.size, writer=writer, journal=journal, metrics=metrics,
+        raw=raw, timeout=timeout, negative_cache=negative_cache
     )
-    duration = time.time() - start_time
+    fallback_pool.shutdown()
+    return results[:-1] + (fallback_pool.stats(),)
 
-    print_summary(success_log, nodata_log, exception_log, duration)
-
-    if master_df is not None:
-        master_df["capture_date"] = pd.to_datetime(master_df["capture_date"], errors="coerce")
-        capture_dates = master_df["capture_date"].dropna().sort_values()
+def rebuild_from_cache(cache, writer=None):
+    all_dfs = []
+    resumed = writer.resumed_urls if writer is not None else set()
+    nodata_urls = []
+    success_log = []
+    nodata_log = []
 
-        if not capture_dates.empty:
-            start_date = capture_dates.iloc[0].strftime("%Y-%m-%d")
-            end_date = capture_dates.iloc[-1].strftime("%Y-%m-%d")
-            if start_date == end_date:
-                filename = f"eci_{start_date}.csv"
+    for url, html in cache.entries():
+        if url in resumed:
+            continue
+        df, status = rows_to_snapshot_df(url, parse_table_rows(html))
+        if status == "success":
+            if writer is not None:
+                writer.write(df)
             else:
-                filename = f"eci_{start_date}_to_{end_date}.csv"
+                all_dfs.append(df)
+            success_log.append(f"✅ From cache: {url}")
         else:
-            filename = "eci_master.csv"
+            nodata_urls.append(url)
+            nodata_log.append(f"⚠️  No valid data in cached page: {url}")
 
-        master_df.to_csv(filename, index=False)
-        print(f"📦 Data saved to {filename}")
+    merged = pd.concat(all_dfs, ignore_index=True) if all_dfs else None
+    return merged, [], nodata_urls, success_log, [], nodata_log, None
 
-    with open("exception_urls.txt", "w") as f:
-        for url in exceptions:
+def clear_log_files(log_dir="."):
+    open(os.path.join(log_dir, "nodata_urls.txt"), "w").close()
+    open(os.path.join(log_dir, "exception_urls.txt"), "w").close()
+
+def write_log_files(journal, log_dir=".", known_empty=()):
+    # Built from the journal, so URLs from an interrupted earlier run are included
+    with open(os.path.join(log_dir, "exception_urls.txt"), "w") as f:
+        for url in journal.urls_with_status("exception"):
             f.write(url + "\n")
 
-    with open("nodata_urls.txt", "w") as f:
-        for url in nodata:
+    with open(os.path.join(log_dir, "nodata_urls.txt"), "w") as f:
+        for url in journal.urls_with_status("no_data"):
+            f.write(url + "\n")
+        # Skipped via the negative cache, but still no-data snapshots of this input
+        for url in known_empty:
             f.write(url + "\n")
 
-    if exceptions:
-        print("\n➡️  Retrying exception URLs up to 3 times each (no delays)...")
-        def retry_scrape(url, max_attempts=3):
-            for attempt in range(max_attempts):
-                df, status = scrape_and_save(url)
-                if status == "success" or status == "no_data":
-                    return df, status
-            return None, "exception"
-
-        retry_dfs = []
-        still_exceptions = []
-        still_nodata = []
-
-        retry_success_log = []
-        retry_exception_log = []
-        retry_nodata_log = []
-
-        start_retry = time.time()
-        for url in exceptions:
-            df, status = retry_scrape(url)
-            if status == "success":
-                retry_dfs.append(df)
-                retry_success_log.append(f"✅ Retry success: {url}")
-            elif status == "no_data":
-                still_nodata.append(url)
-                retry_nodata_log.append(f"⚠️ Retry no data: {url}")
-            else:
-                still_exceptions.append(url)
-                retry_exception_log.append(f"❌ Retry exception: {url}")
-        retry_duration = time.time() - start_retry
-
-        if retry_dfs:
-            retry_merged = pd.concat(retry_dfs, ignore_index=True)
-            if master_df is not None:
-                master_df = pd.concat([master_df, retry_merged], ignore_index=True)
-            else:
-                master_df = retry_merged
-
-            # Apply same filename logic after retries
-            master_df["capture_date"] = pd.to_datetime(master_df["capture_date"], errors="coerce")
-            capture_dates = master_df["capture_date"].dropna().sort_values()
-
-            if not capture_dates.empty:
-                start_date = capture_dates.iloc[0].strftime("%Y-%m-%d")
-                end_date = capture_dates.iloc[-1].strftime("%Y-%m-%d")
-                if start_date == end_date:
-                    filename = f"eci_{start_date}.csv"
-                else:
-                    filename = f"eci_{start_date}_to_{end_date}.csv"
-            else:
-                filename = "eci_master.csv"
+def read_input_urls(path, initiative_ids=None):
+    with open(path, "r") as file:
+        urls = [line.strip() for line in file if line.strip()]
+    if initiative_ids:
+        urls = [url for url in urls if extract_initiative_id(url) in initiative_ids]
+    return urls
+
+def add_scrape_arguments(parser):
+    parser.add_argument("--input", default="input_urls.txt", help="Snapshot URLs to scrape, one per line")
+    parser.add_argument("--initiative", action="append", metavar="ID",
+                        help="Only scrape snapshots of this initiative (repeatable)")
+    parser.add_argument("--engine", choices=["selenium", "http", "async"], default="selenium",
+                        help="http/async try a plain fetch first and only render JS-built pages")
+    parser.add_argument("--workers", type=int, default=4, help="Worker threads (and browsers) for selenium/http")
+    parser.add_argument("--concurrency", type=int, default=32, help="Requests in flight for the async engine")
+    parser.add_argument("--rate", type=float, default=5.0, help="Requests per second per host for the async engine")
+    parser.add_argument("--burst", type=int, default=10, help="Requests the async engine may send at once per host")
+    parser.add_argument("--retries", type=int, default=3)
+    parser.add_argument("--timeout", type=float, default=20, help="Page load / HTTP timeout in seconds")
+    parser.add_argument("--table-timeout", type=float, default=10,
+                        help="Seconds a browser waits for the table to appear")
+    parser.add_argument("--output-dir", default=".", help="Where the dated output and URL logs are written")
+    parser.add_argument("--format", choices=["csv", "parquet"], default="csv",
+                        help="Format of the dated output file (--incremental always updates the master CSV)")
+    parser.add_argument("--cache-dir", default="page_cache")
+    parser.add_argument("--cache-size-mb", type=int, default=500)
+    parser.add_argument("--no-cache", action="store_true")
+    parser.add_argument("--offline", action="store_true", help="Rebuild the CSV purely from cached pages")
+    parser.add_argument("--incremental", action="store_true",
+                        help="Only scrape snapshots missing from --master and merge them into it")
+    parser.add_argument("--master", default=DEFAULT_CSV, help="Master dataset used by --incremental")
+    parser.add_argument("--dataset", metavar="DIR",
+                        help="Also write rows into the partitioned Parquet dataset "
+                             "(default with --incremental: Dataset/ if it exists)")
+    parser.add_argument("--expand-duplicates", metavar="GROUPS_JSON",
+                        help="Digest groups from snapshot_dedup.py; copies each scraped page's rows to every identical capture")
+    parser.add_argument("--crossing-index", metavar="CSV", help="Also update the threshold first-crossing index")
+    parser.add_argument("--timeseries", metavar="SQLITE", help="Also update the SQLite time-series store")
+    parser.add_argument("--staging", default=STAGING_PATH,
+                        help="Append-only CSV that rows stream into; a killed run resumes from it")
+    parser.add_argument("--journal", default=JOURNAL_PATH,
+                        help="Per-URL progress journal; a restarted run only scrapes outstanding URLs")
+    parser.add_argument("--negative-cache", default=NEGATIVE_CACHE_PATH,
+                        help="Snapshots known to have no data, with the reason; they are skipped on later runs")
+    parser.add_argument("--recheck-nodata", action="store_true",
+                        help="Scrape known no-data snapshots again (the cache is still updated)")
+    parser.add_argument("--render-profile", choices=RENDER_PROFILES, default="full",
+                        help="lean blocks images, fonts, CSS, the Wayback toolbar and analytics, and loads eagerly")
+    parser.add_argument("--raw", action="store_true",
+                        help="http/async: download the original archived bytes (<timestamp>id_ URLs)")
+    parser.add_argument("--metrics-json", metavar="PATH", help="Write per-stage latency percentiles as JSON")
+    parser.add_argument("--metrics-prom", metavar="PATH", help="Write the same metrics as a Prometheus textfile")
+    return parser
+
+def main(args, parser):
+    digest_groups = load_groups(args.expand_duplicates) if args.expand_duplicates else None
+    writer = RowWriter(args.staging, transform=lambda df: expand_duplicates(df, digest_groups))
+    if writer.resumed_urls:
+        print(f"➡️  Resuming: {len(writer.resumed_urls)} snapshots already in '{args.staging}'")
+
+    master_path = args.master if args.incremental else None
+    if master_path is not None and not os.path.exists(master_path):
+        # Otherwise every snapshot would count as new and be scraped again
+        parser.error(f"--incremental: master dataset '{master_path}' not found; pass --master or run without it")
+    if master_path is not None and args.dataset is None and os.path.isdir(DATASET_DIR):
+        # Analyses read Dataset/ once it exists, so it has to get the new rows as well
+        args.dataset = DATASET_DIR
+    os.makedirs(args.output_dir, exist_ok=True)
+
+    engine = args.engine
+    cache = None if args.no_cache else PageCache(args.cache_dir, max_bytes=args.cache_size_mb * 1024 * 1024)
+
+    journal = None
+    known_empty = {}
+    metrics = ScrapeMetrics()
+    if args.offline:
+        if cache is None:
+            parser.error("--offline needs the page cache")
+        print(f"➡️  Rebuilding dataset from cache in '{args.cache_dir}'...")
+        start_time = time.time()
+        _, exceptions, nodata, success_log, exception_log, nodata_log, pool_stats = rebuild_from_cache(cache, writer)
+    else:
+        journal = ScrapeJournal(args.journal)
+        journal.forget(journal.unsaved(writer.resumed_urls))
+        if journal.is_empty():
+            clear_log_files(args.output_dir)
+        else:
+            counts = journal.counts()
+            print(f"➡️  Resuming from '{args.journal}': " +
+                  ", ".join(f"{n} {status}" for status, n in sorted(counts.items())))
 
-            master_df.to_csv(filename, index=False)
-            print(f"📦 Updated {filename} with retry successes")
+        eci_urls = read_input_urls(args.input, args.initiative)
 
-        print_summary(retry_success_log, retry_nodata_log, retry_exception_log, retry_duration)
+        if args.incremental:
+            already_scraped = scraped_urls(load_master(master_path))
+            eci_urls = [url for url in eci_urls if url not in already_scraped]
+            print(f"➡️  {len(already_scraped)} snapshots already in {master_path}, {len(eci_urls)} left to scrape")
 
-        with open("exception_urls.txt", "w") as f:
-            for url in still_exceptions:
-                f.write(url + "\n")
+        eci_urls = [url for url in journal.outstanding(eci_urls) if url not in writer.resumed_urls]
+        negative_cache = NegativeCache(args.negative_cache)
+        if args.recheck_nodata:
+            rechecked = negative_cache.known_empty(eci_urls)
+        else:
+            eci_urls, known_empty = skip_known_empty(eci_urls, negative_cache)
+
+        print("➡️  Starting initial scrape pass...")
+        start_time = time.time()
+        _, exceptions, nodata, success_log, exception_log, nodata_log, pool_stats = run_scrape(
+            eci_urls, engine=engine, max_threads=args.workers, concurrency=args.concurrency, retries=args.retries,
+            cache=cache, writer=writer, journal=journal, metrics=metrics, render_profile=args.render_profile,
+            raw=args.raw, timeout=args.timeout, table_timeout=args.table_timeout, negative_cache=negative_cache,
+            rate=args.rate, burst=args.burst
+        )
+        if args.recheck_nodata:
+            # Only the rechecked snapshots that now have data lose their verdict
+            negative_cache.invalidate(set(rechecked) & set(journal.urls_with_status("success")))
+        negative_cache.close()
+    duration = time.time() - start_time
 
-        with open("nodata_urls.txt", "w") as f:
-            for url in nodata + still_nodata:
-                f.write(url + "\n")
+    print_summary(success_log, nodata_log, exception_log, duration, pool_stats=pool_stats,
+                  cache_stats=cache.stats() if cache is not None else None)
+    metrics.print_table(duration)
+    if args.metrics_json:
+        metrics.write_json(args.metrics_json, duration)
+    if args.metrics_prom:
+        metrics.write_prometheus(args.metrics_prom, duration)
+
+    if journal is not None:
+        write_log_files(journal, args.output_dir, known_empty)
+
+    # === Output ===
+    if writer.has_rows():
+        # Master first, so the Parquet dataset updated below is never older than it
+        if master_path is not None:
+            filename, _ = save_scrape_results(writer.read(**TEXT_CSV), master_path)
+
+        # Downstream stores take the new rows a chunk at a time
+        if args.dataset or args.crossing_index or args.timeseries:
+            for chunk in writer.read(chunksize=OUTPUT_CHUNK_ROWS):
+                if args.dataset:
+                    append_to_dataset(chunk, args.dataset)
+                if args.crossing_index:
+                    ingest(chunk, args.crossing_index)
+                if args.timeseries:
+                    ingest_timeseries(chunk, args.timeseries)
+            if args.dataset:
+                print(f"📦 Parquet partitions updated in {args.dataset}")
+
+        if master_path is not None:
+            writer.discard()
+        elif args.format == "parquet":
+            filename = os.path.join(args.output_dir, range_filename(writer.first_date, writer.last_date))
+            filename = os.path.splitext(filename)[0] + ".parquet"
+            write_parquet_atomic(writer.read(), filename)
+            writer.discard()
+        else:
+            filename = writer.commit(os.path.join(args.output_dir, range_filename(writer.first_date, writer.last_date)))
+        print(f"📦 {writer.rows} rows saved to {filename}")
+    else:
+        writer.discard()
+
+    if journal is not None:
+        journal.reset()
 
     print("\n🎉 Scraping complete.")
+
+if __name__ == "__main__":
+    parser = add_scrape_arguments(argparse.ArgumentParser(description="Scrape ECI country tables from Wayback snapshots."))
+    main(parser.parse_args(), parser)
@@ -1,42 +1,65 @@
-from waybackpy import WaybackMachineCDXServerAPI
-from datetime import timedelta, datetime
-import time
+import argparse
 import os
+import shutil
+import time
+from datetime import timedelta
+from cdx_client import CDX_ENDPOINT, initiative_slug, initiative_url, list_snapshots, read_records, snapshot_date
+from http_engine import USER_AGENT, create_session
 
 # === Setup ===
-url = "https://citizens-initiative.europa.eu/initiatives/details/2024/000007_en"
-user_agent = "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
+DEFAULT_URL = "https://citizens-initiative.europa.eu/initiatives/details/2024/000007_en"
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 
-# === Snapshot fetching ===
-start_time = time.time()
-cdx_api = WaybackMachineCDXServerAPI(url, user_agent)
-snapshots = list(cdx_api.snapshots())
-duration = time.time() - start_time
+def add_list_arguments(parser):
+    parser.add_argument("--url", action="append", help="Page to list (repeatable; default: initiative 2024/000007)")
+    parser.add_argument("--initiative", action="append", metavar="ID",
+                        help="Initiative ID such as 2024/000007 (repeatable)")
+    parser.add_argument("--endpoint", default=CDX_ENDPOINT, help="CDX endpoint (point at stub_server.py for testing)")
+    parser.add_argument("--collapse", default="digest",
+                        help="Server-side collapse, e.g. 'digest', 'timestamp:10' (hourly) or 'none'")
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--timeout", type=float, default=60, help="CDX request timeout in seconds")
+    parser.add_argument("--user-agent", default=USER_AGENT)
+    parser.add_argument("--links-dir", default=os.path.join(BASE_DIR, "Snapshot Links"))
+    parser.add_argument("--restart", action="store_true", help="Ignore saved progress and list from scratch")
+    return parser
 
-# === Extract snapshot dates ===
-def extract_date(snapshot):
-    timestamp = snapshot.archive_url.split("/")[4]  # e.g. 20240612133710
-    return datetime.strptime(timestamp[:8], "%Y%m%d")  # extract YYYYMMDD
+def list_one(url, args, session, tag=""):
+    # === Snapshot fetching (streamed to disk page by page) ===
+    start_time = time.time()
+    collapse = None if args.collapse == "none" else args.collapse
+    written, links_path, records_path = list_snapshots(
+        url, args.links_dir, endpoint=args.endpoint, collapse=collapse,
+        page_size=args.page_size, resume=not args.restart, session=session, timeout=args.timeout
+    )
+    duration = time.time() - start_time
 
-# === Generate filename and directory path ===
-if snapshots:
-    snapshot_dates = [extract_date(s) for s in snapshots]
-    latest = max(snapshot_dates)
-    earliest = min(snapshot_dates)
-    filename = f"snapshotLinks_{earliest.date()}_to_{latest.date()}.txt"
-else:
-    filename = "snapshotLinks_NO_SNAPSHOTS.txt"
+    # === Dated copy of the full listing, as before ===
+    records = read_records(records_path)
+    if records:
+        snapshot_dates = [snapshot_date(r) for r in records]
+        filename = f"snapshotLinks_{tag}{min(snapshot_dates).date()}_to_{max(snapshot_dates).date()}.txt"
+    else:
+        filename = f"snapshotLinks_{tag}NO_SNAPSHOTS.txt"
+    full_path = os.path.join(args.links_dir, filename)
+    shutil.copyfile(links_path, full_path)
 
-# === File destination ===
-base_dir = os.path.dirname(os.path.abspath(__file__))
-csv_dir = os.path.join(base_dir, "Snapshot Links")
-os.makedirs(csv_dir, exist_ok=True)  # Create folder if it doesn't exist
-full_path = os.path.join(csv_dir, filename)
+    print(f"\nFetched {written} new snapshots ({len(records)} total) into '{links_path}'")
+    print(f"Saved listing to '{full_path}'")
+    print("\nTime taken: " + str(timedelta(seconds=round(duration))) + "\n")
+    return links_path
 
-# === Write output ===
-with open(full_path, "w", encoding="utf-8") as f:
-    for snapshot in snapshots:
-        f.write(snapshot.archive_url + "\n")
+def main(args):
+    urls = list(args.url or []) + [initiative_url(i) for i in args.initiative or []] or [DEFAULT_URL]
+    session = create_session(1, user_agent=args.user_agent)
+    try:
+        # Several listings in one run get the initiative in their dated file name
+        return [list_one(url, args, session, tag=f"{initiative_slug(url)}_" if len(urls) > 1 else "")
+                for url in urls]
+    finally:
+        session.close()
 
-print(f"\nSaved {len(snapshots)} snapshots to '{full_path}'")
-print("\nTime taken: " + str(timedelta(seconds=round(duration))) + "\n")
+if __name__ == "__main__":
+    parser = add_list_arguments(argparse.ArgumentParser(
+        description="List Wayback snapshots of an ECI initiative page via the CDX API."))
+    main(parser.parse_args())
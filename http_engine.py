@@ -0,0 +1,68 @@
+import requests
+from requests.adapters import HTTPAdapter
+from page_classifier import PREFIX_CHARS, classify_page
+from retry_scheduler import parse_retry_after
+from scrape_metrics import timed
+from snapshot_table import parse_table_rows, raw_snapshot_url, rows_to_snapshot_df
+
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"
+
+class PageAborted(Exception):
+    def __init__(self, status, reason, response):
+        super().__init__(reason)
+        self.status = status
+        self.reason = reason
+        self.response = response
+
+def create_session(pool_size=8, user_agent=USER_AGENT):
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    session.headers["User-Agent"] = user_agent
+    return session
+
+def fetch_html(url, session, timeout=20):
+    response = session.get(url, timeout=timeout)
+    verdict = classify_page(url, response.url, response.text[:PREFIX_CHARS], response.status_code)
+    if verdict is not None:
+        raise PageAborted(*verdict, response)
+    response.raise_for_status()
+    return response.text
+
+def scrape_with_http(url, session, timeout=20, fallback=None, cache=None, info=None, raw=False):
+    try:
+        html = None
+        if cache is not None:
+            with timed(info, "cache"):
+                html = cache.get(url)
+        if html is None:
+            with timed(info, "fetch"):
+                # Rows keep the normal snapshot URL; only the download uses the raw form
+                html = fetch_html(raw_snapshot_url(url) if raw else url, session, timeout=timeout)
+            if cache is not None:
+                cache.put(url, html)
+        with timed(info, "parse"):
+            rows = parse_table_rows(html)
+    except PageAborted as e:
+        # Error pages, redirect stubs and captchas never reach the cache or the browser fallback
+        print(f"⛔ Aborted ({e.reason}, HTTP {e.response.status_code}): {url}")
+        if info is not None:
+            info["reason"] = e.reason
+            if e.status == "exception":
+                info["retry_after"] = parse_retry_after(e.response.headers.get("Retry-After"))
+        return None, e.status
+    except Exception as e:
+        response = getattr(e, "response", None)
+        if info is not None and response is not None:
+            info["retry_after"] = parse_retry_after(response.headers.get("Retry-After"))
+        print(f"❌ Exception for URL {url}: {e}")
+        return None, "exception"
+
+    # The table is sometimes rendered client-side; only then pay for a browser
+    if not rows and fallback is not None:
+        print(f"↪️  No table in static HTML, falling back to Selenium: {url}")
+        return fallback(url)
+
+    with timed(info, "build"):
+        return rows_to_snapshot_df(url, rows, info)
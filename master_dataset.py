@@ -0,0 +1,73 @@
+import os
+import pandas as pd
+from snapshot_table import add_initiative_id
+
+def dataset_filename(df):
+    capture_dates = pd.to_datetime(df["capture_date"], errors="coerce").dropna().sort_values()
+
+    if capture_dates.empty:
+        return "eci_master.csv"
+
+    return range_filename(capture_dates.iloc[0].strftime("%Y-%m-%d"), capture_dates.iloc[-1].strftime("%Y-%m-%d"))
+
+def range_filename(start_date, end_date):
+    if start_date is None:
+        return "eci_master.csv"
+    if start_date == end_date:
+        return f"eci_{start_date}.csv"
+    return f"eci_{start_date}_to_{end_date}.csv"
+
+# Master rows are handled as text so existing rows are written back exactly as
+# read: a blank Threshold would otherwise turn the column into floats (13395.0)
+TEXT_CSV = {"dtype": str, "keep_default_na": False}
+
+def load_master(path):
+    if not os.path.exists(path):
+        return None
+    return pd.read_csv(path, **TEXT_CSV)
+
+def scraped_urls(master_df):
+    if master_df is None or "snapshot_url" not in master_df.columns:
+        return set()
+    return set(master_df["snapshot_url"].dropna())
+
+def merge_into_master(master_df, new_df):
+    # Existing rows keep their text and order; only the new rows are sorted and appended
+    key = ["snapshot_url", "Country"]
+    if master_df is not None and "initiative_id" in master_df.columns and "initiative_id" not in new_df.columns:
+        new_df = add_initiative_id(new_df)
+    new_df = new_df.drop_duplicates(subset=key, keep="last")
+    new_df = new_df.sort_values(["capture_date", "GMT_capture_time"], kind="stable")
+    if master_df is None:
+        return new_df.reset_index(drop=True)
+
+    # Later scrapes win if the same snapshot shows up twice
+    replaced = pd.MultiIndex.from_frame(master_df[key]).isin(pd.MultiIndex.from_frame(new_df[key]))
+    merged = pd.concat([master_df[~replaced], new_df], ignore_index=True)
+    return merged.reindex(columns=list(dict.fromkeys([*master_df.columns, *new_df.columns]))).fillna("")
+
+def write_csv_atomic(df, path):
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    df.to_csv(tmp_path, index=False)
+    os.replace(tmp_path, path)
+
+def write_parquet_atomic(df, path):
+    directory = os.path.dirname(os.path.abspath(path))
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    df.to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, path)
+
+def save_scrape_results(df, master_path=None):
+    if master_path is None:
+        df = df.copy()
+        df["capture_date"] = pd.to_datetime(df["capture_date"], errors="coerce")
+        filename = dataset_filename(df)
+        write_csv_atomic(df, filename)
+        return filename, df
+
+    merged = merge_into_master(load_master(master_path), df)
+    write_csv_atomic(merged, master_path)
+    return master_path, merged
@@ -0,0 +1,124 @@
+import argparse
+import sqlite3
+import threading
+import time
+from collections import Counter
+
+# Snapshots that had no data, and why, kept across runs so pre-launch
+# captures and error pages are not rendered again every time. Archived
+# pages do not change, so most verdicts stand until invalidated; the ones
+# that can come from a slow or flaky fetch expire after a TTL.
+
+NEGATIVE_CACHE_PATH = "negative_cache.sqlite3"
+# Stays well under SQLite's limit on bound variables per statement
+INVALIDATE_BATCH = 500
+
+# Seconds a verdict is trusted; None = until explicitly invalidated
+REASON_TTLS = {
+    "no_table": 7 * 24 * 3600,      # may just be a table that rendered too slowly
+    "header_only": None,
+    "unparsable": None,
+    "http_error": 24 * 3600,
+    "redirect": None,
+    "wayback_error": None,
+}
+DEFAULT_REASON = "no_table"
+
+class NegativeCache:
+    def __init__(self, path=NEGATIVE_CACHE_PATH, ttls=REASON_TTLS):
+        self.path = path
+        self.ttls = ttls
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS nodata ("
+            " url TEXT PRIMARY KEY,"
+            " reason TEXT NOT NULL,"
+            " seen INTEGER NOT NULL,"
+            " checked_at REAL NOT NULL)"
+        )
+
+    def record(self, url, reason=None):
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO nodata (url, reason, seen, checked_at) VALUES (?, ?, 1, ?) "
+                "ON CONFLICT(url) DO UPDATE SET reason = excluded.reason, seen = seen + 1, "
+                "checked_at = excluded.checked_at",
+                (url, reason or DEFAULT_REASON, time.time()),
+            )
+
+    def _valid(self, reason, checked_at, now):
+        ttl = self.ttls.get(reason)
+        return ttl is None or now - checked_at < ttl
+
+    def entries(self):
+        with self._lock:
+            return self._conn.execute("SELECT url, reason, seen, checked_at FROM nodata ORDER BY url").fetchall()
+
+    def known_empty(self, urls=None):
+        # url -> reason for every verdict that has not expired
+        now = time.time()
+        wanted = set(urls) if urls is not None else None
+        return {
+            url: reason for url, reason, _, checked_at in self.entries()
+            if (wanted is None or url in wanted) and self._valid(reason, checked_at, now)
+        }
+
+    def invalidate(self, urls=None, reasons=None):
+        if urls is None:
+            return self._delete([], reasons)
+        urls = list(urls)
+        return sum(self._delete(urls[i:i + INVALIDATE_BATCH], reasons) for i in range(0, len(urls), INVALIDATE_BATCH))
+
+    def _delete(self, urls, reasons):
+        clauses, params = [], []
+        if urls:
+            clauses.append(f"url IN ({', '.join('?' for _ in urls)})")
+            params += urls
+        if reasons:
+            clauses.append(f"reason IN ({', '.join('?' for _ in reasons)})")
+            params += list(reasons)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        with self._lock:
+            return self._conn.execute(f"DELETE FROM nodata{where}", params).rowcount
+
+    def counts(self):
+        now = time.time()
+        counts = Counter()
+        for _, reason, _, checked_at in self.entries():
+            counts[reason if self._valid(reason, checked_at, now) else f"{reason} (expired)"] += 1
+        return dict(counts)
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+def skip_known_empty(url_list, negative_cache):
+    known = negative_cache.known_empty(url_list)
+    if known:
+        reasons = Counter(known.values())
+        print(f"🚫 Skipping {len(known)} snapshots known to have no data: " +
+              ", ".join(f"{n} {reason}" for reason, n in sorted(reasons.items())))
+    return [url for url in url_list if url not in known], known
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Inspect or invalidate the no-data snapshot cache.")
+    parser.add_argument("--path", default=NEGATIVE_CACHE_PATH)
+    parser.add_argument("--list", action="store_true", help="Print every cached URL with its reason")
+    parser.add_argument("--invalidate", nargs="*", metavar="URL", help="Forget these URLs (all if none given)")
+    parser.add_argument("--reason", action="append", choices=list(REASON_TTLS),
+                        help="Only invalidate verdicts with this reason (repeatable)")
+    args = parser.parse_args()
+    if args.reason and args.invalidate is None:
+        parser.error("--reason only narrows --invalidate; add --invalidate")
+
+    cache = NegativeCache(args.path)
+    if args.invalidate is not None:
+        removed = cache.invalidate(args.invalidate or None, args.reason)
+        print(f"🗑️  Invalidated {removed} entries")
+    if args.list:
+        for url, reason, seen, checked_at in cache.entries():
+            print(f"{reason:<12} seen {seen}x  {time.strftime('%Y-%m-%d %H:%M', time.localtime(checked_at))}  {url}")
+    print(", ".join(f"{n} {reason}" for reason, n in sorted(cache.counts().items())) or "Cache is empty")
+    cache.close()
@@ -0,0 +1,100 @@
+import gzip
+import hashlib
+import json
+import os
+import re
+import threading
+
+# Wayback snapshots never change once the 14-digit timestamp is fixed, so a
+# page fetched once can be served from disk on every later run.
+
+def snapshot_key(url):
+    match = re.search(r'/web/(\d{14})[a-z_]*/(.+)$', url)
+    identity = f"{match.group(1)}/{match.group(2)}" if match else url
+    return hashlib.sha256(identity.encode("utf-8")).hexdigest()
+
+class PageCache:
+    def __init__(self, cache_dir="page_cache", max_bytes=500 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+
+        os.makedirs(cache_dir, exist_ok=True)
+        self.total_bytes = sum(os.path.getsize(path) for path in self._entry_paths())
+
+    def _path(self, url):
+        key = snapshot_key(url)
+        return os.path.join(self.cache_dir, key[:2], f"{key}.json.gz")
+
+    def _entry_paths(self):
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if name.endswith(".json.gz"):
+                    yield os.path.join(root, name)
+
+    def get(self, url):
+        path = self._path(url)
+        try:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                entry = json.load(f)
+            os.utime(path)  # mtime doubles as the LRU clock
+        except (OSError, ValueError):
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return entry["html"]
+
+    def put(self, url, html):
+        path = self._path(url)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with gzip.open(tmp_path, "wt", encoding="utf-8") as f:
+            json.dump({"url": url, "html": html}, f)
+
+        old_size = os.path.getsize(path) if os.path.exists(path) else 0
+        os.replace(tmp_path, path)
+        with self._lock:
+            self.writes += 1
+            self.total_bytes += os.path.getsize(path) - old_size
+            over_budget = self.total_bytes > self.max_bytes
+        if over_budget:
+            self.evict()
+
+    def evict(self):
+        with self._lock:
+            paths = sorted(self._entry_paths(), key=os.path.getmtime)
+            target = self.max_bytes * 0.9
+            for path in paths:
+                if self.total_bytes <= target:
+                    break
+                size = os.path.getsize(path)
+                os.remove(path)
+                self.total_bytes -= size
+                self.evictions += 1
+
+    def entries(self):
+        for path in self._entry_paths():
+            try:
+                with gzip.open(path, "rt", encoding="utf-8") as f:
+                    entry = json.load(f)
+            except (OSError, ValueError):
+                continue
+            yield entry["url"], entry["html"]
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "writes": self.writes,
+                "evictions": self.evictions,
+                "size_mb": self.total_bytes / (1024 * 1024),
+                "max_mb": self.max_bytes / (1024 * 1024),
+            }
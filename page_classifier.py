@@ -0,0 +1,48 @@
+import re
+from snapshot_table import SNAPSHOT_TIMESTAMP
+
+# Wayback error pages, redirect stubs and captchas never contain the
+# table, yet the browser would still wait the full table timeout on them.
+# These checks only need the status, the final URL and the start of the
+# page, so they run right after navigation and abort straight away.
+
+PREFIX_CHARS = 16384
+
+# Client errors that mean the capture itself is missing; retrying will not help
+NODATA_STATUSES = (404, 410, 451)
+
+# (outcome, reason, pattern) matched against the lowercased page start.
+# no_data verdicts go to the negative cache; exceptions are retried later.
+PAGE_PATTERNS = [
+    ("no_data", "redirect", re.compile(r"got an http 30\d response at crawl time")),
+    ("no_data", "wayback_error", re.compile(r"got an http [45]\d\d response at crawl time")),
+    ("no_data", "wayback_error", re.compile(r"wayback machine has not archived that url")),
+    ("no_data", "wayback_error", re.compile(r"this url has been (excluded|blocked)")),
+    ("exception", "unavailable", re.compile(r"wayback machine is (temporarily offline|under heavy load)")),
+    ("exception", "captcha", re.compile(r"<title>\s*(just a moment|attention required)|captcha-delivery")),
+]
+
+# Prefix of the visible text, read in the same round-trip as the final URL
+PAGE_PREFIX_SCRIPT = """
+const title = document.title || "";
+const text = document.body ? document.body.innerText : "";
+return [location.href, "<title>" + title + "</title> " + text.slice(0, arguments[0])];
+"""
+
+def capture_moved(url, final_url):
+    # Wayback answers a missing capture with a redirect to the nearest other one
+    requested, landed = SNAPSHOT_TIMESTAMP.search(url), SNAPSHOT_TIMESTAMP.search(final_url or url)
+    return bool(requested and landed and requested.group(1) != landed.group(1))
+
+def classify_page(url, final_url=None, prefix="", status=None):
+    # (status, reason) for a page that cannot hold the table, else None
+    if status in NODATA_STATUSES:
+        return "no_data", "http_error"
+    if capture_moved(url, final_url):
+        return "no_data", "redirect"
+
+    text = " ".join(prefix[:PREFIX_CHARS].lower().split())
+    for outcome, reason, pattern in PAGE_PATTERNS:
+        if pattern.search(text):
+            return outcome, reason
+    return None
@@ -0,0 +1,122 @@
+import heapq
+import random
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+# Failed URLs wait on a delayed queue instead of sleeping inside a worker,
+# so the pool keeps scraping other pages while they back off.
+
+def parse_retry_after(value):
+    # Retry-After is either delta-seconds or an HTTP date
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+class RetryPolicy:
+    def __init__(self, base_delay=60, max_delay=900, jitter=0.5):
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.jitter = jitter
+
+    def delay(self, attempt, retry_after=None):
+        backoff = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        # Spread retries out so failures from one burst do not come back together
+        backoff *= random.uniform(1 - self.jitter, 1)
+        if retry_after is not None:
+            return max(backoff, retry_after)
+        return backoff
+
+class CircuitBreaker:
+    # Trips when too many recent requests failed and holds back all new
+    # work for a cool-down that doubles each time it trips again.
+    def __init__(self, window=20, min_samples=10, threshold=0.5, cooldown=30, max_cooldown=300):
+        self.window = deque(maxlen=window)
+        self.min_samples = min_samples
+        self.threshold = threshold
+        self.base_cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.cooldown = cooldown
+        self.open_until = 0.0
+        self.trips = 0
+        self._lock = threading.Lock()
+
+    def record(self, ok):
+        with self._lock:
+            self.window.append(ok)
+            if len(self.window) < self.min_samples:
+                return
+            error_rate = self.window.count(False) / len(self.window)
+            if error_rate >= self.threshold:
+                self.trips += 1
+                self.open_until = time.monotonic() + self.cooldown
+                print(f"🧯 Error rate {error_rate:.0%} over the last {len(self.window)} requests; "
+                      f"pausing new requests for {self.cooldown:.0f}s")
+                self.cooldown = min(self.max_cooldown, self.cooldown * 2)
+                self.window.clear()
+            elif error_rate == 0:
+                self.cooldown = self.base_cooldown
+
+    def remaining(self):
+        return max(0.0, self.open_until - time.monotonic())
+
+class RetryScheduler:
+    def __init__(self, url_list, retries=3, policy=None, breaker=None):
+        self.retries = retries
+        self.policy = policy or RetryPolicy()
+        self.breaker = breaker or CircuitBreaker()
+        self.attempts = {}
+        self.retried = 0
+        self._fresh = deque(url_list)
+        self._delayed = []
+
+    def pending(self):
+        return bool(self._fresh or self._delayed)
+
+    def next_ready(self):
+        if self.breaker.remaining() > 0:
+            return None
+        # Retries that are due go first, ahead of URLs never tried
+        if self._delayed and self._delayed[0][0] <= time.monotonic():
+            url = heapq.heappop(self._delayed)[2]
+        elif self._fresh:
+            url = self._fresh.popleft()
+        else:
+            return None
+        self.attempts[url] = self.attempts.get(url, 0) + 1
+        return url
+
+    def next_delay(self):
+        # Seconds until next_ready could return something; None if only
+        # in-flight work can change that
+        paused = self.breaker.remaining()
+        if paused > 0:
+            return paused
+        if self._fresh:
+            return 0.0
+        if self._delayed:
+            return max(0.0, self._delayed[0][0] - time.monotonic())
+        return None
+
+    def complete(self, url, status, retry_after=None):
+        # Returns the retry delay if the URL was put back on the queue, else None
+        self.breaker.record(status != "exception")
+        attempt = self.attempts.get(url, 1)
+        if status != "exception" or attempt >= self.retries:
+            return None
+
+        delay = self.policy.delay(attempt, retry_after)
+        heapq.heappush(self._delayed, (time.monotonic() + delay, attempt, url))
+        self.retried += 1
+        return delay
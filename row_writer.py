@@ -0,0 +1,142 @@
+import csv
+import os
+import pandas as pd
+
+# Scraped rows go straight to an append-only staging CSV as each page
+# finishes, so memory stays flat and a crash keeps everything already
+# written. The staging file is renamed into place once the run is done.
+
+STAGING_PATH = "scrape_rows.partial.csv"
+
+def _blocks_path(path):
+    # Byte offset of the staging file after each complete write, one per line
+    return f"{path}.blocks"
+
+def _committed_size(path):
+    # End of the last write known to be complete, or None for a file without offsets
+    blocks_path = _blocks_path(path)
+    if not os.path.exists(blocks_path):
+        return None
+    with open(blocks_path, "r", encoding="utf-8") as f:
+        offsets = [int(line) for line in f.read().split("\n")[:-1] if line.strip().isdigit()]
+    return min(offsets[-1], os.path.getsize(path)) if offsets else 0
+
+def _repair(path):
+    # A kill can tear the last write. One write can hold several snapshots (a page
+    # plus its --expand-duplicates copies), so the whole block is cut back to the
+    # end of the last write recorded as complete and its page is scraped again.
+    size = _committed_size(path)
+    if size is not None:
+        if size == 0:
+            os.remove(path)
+            return None
+        with open(path, "r+b") as f:
+            f.truncate(size)
+        with open(path, "r", newline="", encoding="utf-8") as f:
+            return next(csv.reader(f))
+
+    # Staging files from before the offsets were kept: cut back to the end of the
+    # last complete line, then drop every row of the last snapshot
+    with open(path, "rb") as f:
+        lines = f.read().splitlines(keepends=True)
+    while lines and not lines[-1].endswith(b"\n"):
+        lines.pop()
+    if not lines:
+        os.remove(path)
+        return None
+
+    columns = next(csv.reader([lines[0].decode("utf-8")]))
+    url_index = columns.index("snapshot_url")
+    keep = len(lines)
+    last_url = None
+    while keep > 1:
+        cells = next(csv.reader([lines[keep - 1].decode("utf-8")]), [])
+        url = cells[url_index] if len(cells) > url_index else None
+        if last_url is not None and url != last_url:
+            break
+        last_url = url
+        keep -= 1
+
+    with open(path, "r+b") as f:
+        f.truncate(sum(len(line) for line in lines[:keep]))
+    return columns
+
+class RowWriter:
+    def __init__(self, path=STAGING_PATH, transform=None):
+        self.path = path
+        self.transform = transform
+        self.rows = 0
+        self.first_date = None
+        self.last_date = None
+
+        self.columns = None
+        self.resumed_urls = set()
+
+        # A staging file left by a killed run is kept and appended to
+        if os.path.exists(path) and os.path.getsize(path) > 0:
+            self.columns = _repair(path)
+        if self.columns is not None:
+            existing = pd.read_csv(path, usecols=["capture_date", "snapshot_url"], dtype=str)
+            self.resumed_urls = set(existing["snapshot_url"].dropna())
+            self._track(existing)
+
+        self._file = open(path, "a", newline="", encoding="utf-8")
+        self._blocks = open(_blocks_path(path), "w" if self.columns is None else "a", encoding="utf-8")
+        if self.columns is not None and os.path.getsize(_blocks_path(path)) == 0:
+            self._blocks.write(f"{os.path.getsize(path)}\n")
+
+    def _track(self, df):
+        self.rows += len(df)
+        dates = df["capture_date"].dropna().astype(str)
+        dates = dates[dates != "unknown_date"]
+        if not dates.empty:
+            self.first_date = min(filter(None, (self.first_date, dates.min())))
+            self.last_date = max(filter(None, (self.last_date, dates.max())))
+
+    def write(self, df):
+        if self.transform is not None:
+            df = self.transform(df)
+        if df is None or df.empty:
+            return
+
+        header = self.columns is None
+        if header:
+            self.columns = list(df.columns)
+        df.reindex(columns=self.columns).to_csv(self._file, header=header, index=False)
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        # Only once the rows are on disk, so an offset never points past a torn write
+        self._blocks.write(f"{os.fstat(self._file.fileno()).st_size}\n")
+        self._blocks.flush()
+        self._track(df)
+
+    def close(self):
+        if not self._file.closed:
+            self._file.close()
+        if not self._blocks.closed:
+            self._blocks.close()
+
+    def has_rows(self):
+        return self.columns is not None
+
+    def read(self, chunksize=None, **kwargs):
+        self.close()
+        return pd.read_csv(self.path, chunksize=chunksize, **kwargs)
+
+    def commit(self, final_path):
+        self.close()
+        directory = os.path.dirname(os.path.abspath(final_path))
+        os.makedirs(directory, exist_ok=True)
+        os.replace(self.path, final_path)
+        self._remove_blocks()
+        return final_path
+
+    def discard(self):
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        self._remove_blocks()
+
+    def _remove_blocks(self):
+        if os.path.exists(_blocks_path(self.path)):
+            os.remove(_blocks_path(self.path))
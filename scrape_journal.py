@@ -0,0 +1,78 @@
+import os
+import sqlite3
+import threading
+from datetime import datetime, timezone
+
+# Durable per-URL progress for a scrape run. Every finished URL is
+# committed as soon as its status is known, so a killed run can be
+# restarted and only the outstanding URLs are fetched again.
+
+JOURNAL_PATH = "scrape_journal.sqlite3"
+FINISHED = ("success", "no_data")
+
+class ScrapeJournal:
+    def __init__(self, path=JOURNAL_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS urls ("
+            " url TEXT PRIMARY KEY,"
+            " status TEXT NOT NULL,"
+            " attempts INTEGER NOT NULL,"
+            " updated_at TEXT NOT NULL)"
+        )
+
+    def record(self, url, status, attempts=1):
+        now = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        with self._lock:
+            self._conn.execute(
+                "INSERT INTO urls (url, status, attempts, updated_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(url) DO UPDATE SET status = excluded.status, "
+                "attempts = attempts + excluded.attempts, updated_at = excluded.updated_at",
+                (url, status, attempts, now),
+            )
+
+    def urls_with_status(self, *statuses):
+        placeholders = ", ".join("?" for _ in statuses)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT url FROM urls WHERE status IN ({placeholders}) ORDER BY updated_at", statuses
+            ).fetchall()
+        return [url for (url,) in rows]
+
+    def forget(self, urls):
+        with self._lock:
+            self._conn.executemany("DELETE FROM urls WHERE url = ?", ((url,) for url in urls))
+
+    def unsaved(self, saved_urls):
+        # Successes whose rows did not survive in the staging file (e.g. dropped as a torn last page)
+        return set(self.urls_with_status("success")) - set(saved_urls)
+
+    def finished(self):
+        return set(self.urls_with_status(*FINISHED))
+
+    def outstanding(self, url_list):
+        done = self.finished()
+        return [url for url in url_list if url not in done]
+
+    def counts(self):
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM urls GROUP BY status").fetchall()
+        return dict(rows)
+
+    def is_empty(self):
+        return not self.counts()
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    def reset(self):
+        # A run that finished cleanly needs no checkpoint; the next run starts fresh
+        self.close()
+        for suffix in ("", "-wal", "-shm"):
+            if os.path.exists(self.path + suffix):
+                os.remove(self.path + suffix)
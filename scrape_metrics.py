@@ -0,0 +1,109 @@
+import json
+import os
+import time
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+import numpy as np
+
+# Per-URL stage timings (driver launch, navigation, wait, extraction,
+# DataFrame build, ...) collected into an info dict by the scrape
+# functions, then aggregated here into percentiles and throughput.
+
+QUANTILES = (50, 95, 99)
+
+@contextmanager
+def timed(info, stage):
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if info is not None:
+            stages = info.setdefault("stages", {})
+            stages[stage] = stages.get(stage, 0.0) + time.perf_counter() - start
+
+class ScrapeMetrics:
+    def __init__(self):
+        self.samples = defaultdict(list)
+        self.statuses = Counter()
+        self.reasons = Counter()
+        self.started = time.time()
+
+    def observe(self, info, status, final=True):
+        # Stages and statuses per attempt; reasons once per URL, for its final outcome
+        self.statuses[status] += 1
+        if final and (info or {}).get("reason"):
+            self.reasons[info["reason"]] += 1
+        for stage, seconds in (info or {}).get("stages", {}).items():
+            self.samples[stage].append(seconds)
+
+    def summary(self, duration_seconds=None):
+        duration = duration_seconds if duration_seconds is not None else time.time() - self.started
+        finished = self.statuses["success"] + self.statuses["no_data"]
+        stages = {}
+        for stage, values in self.samples.items():
+            values = np.asarray(values)
+            stages[stage] = {
+                "count": int(values.size),
+                "sum": float(values.sum()),
+                **{f"p{q}": float(np.percentile(values, q)) for q in QUANTILES},
+            }
+        return {
+            "duration_seconds": duration,
+            "urls_per_minute": finished / duration * 60 if duration else 0.0,
+            "attempts": dict(self.statuses),
+            "reasons": dict(self.reasons),
+            "stages": stages,
+        }
+
+    def print_table(self, duration_seconds=None):
+        summary = self.summary(duration_seconds)
+        if not summary["stages"]:
+            return
+        print(f"📈 Stage latency (seconds) | {summary['urls_per_minute']:.1f} URLs/min")
+        print(f"   {'stage':<16}{'count':>7}{'p50':>9}{'p95':>9}{'p99':>9}")
+        for stage, s in summary["stages"].items():
+            print(f"   {stage:<16}{s['count']:>7}{s['p50']:>9.3f}{s['p95']:>9.3f}{s['p99']:>9.3f}")
+        if summary["reasons"]:
+            print("   No-data / abort reasons: " +
+                  ", ".join(f"{n} {reason}" for reason, n in sorted(summary["reasons"].items())))
+        print()
+
+    def write_json(self, path, duration_seconds=None):
+        _write_atomic(path, json.dumps(self.summary(duration_seconds), indent=2))
+
+    def write_prometheus(self, path, duration_seconds=None):
+        # Textfile-collector format, e.g. for node_exporter
+        summary = self.summary(duration_seconds)
+        lines = [
+            "# HELP eci_scrape_stage_seconds Per-URL scrape stage latency.",
+            "# TYPE eci_scrape_stage_seconds summary",
+        ]
+        for stage, s in summary["stages"].items():
+            for q in QUANTILES:
+                lines.append(f'eci_scrape_stage_seconds{{stage="{stage}",quantile="{q / 100}"}} {s[f"p{q}"]:.6f}')
+            lines.append(f'eci_scrape_stage_seconds_sum{{stage="{stage}"}} {s["sum"]:.6f}')
+            lines.append(f'eci_scrape_stage_seconds_count{{stage="{stage}"}} {s["count"]}')
+
+        lines += ["# HELP eci_scrape_attempts_total Scrape attempts by outcome.",
+                  "# TYPE eci_scrape_attempts_total counter"]
+        for status, count in sorted(summary["attempts"].items()):
+            lines.append(f'eci_scrape_attempts_total{{status="{status}"}} {count}')
+
+        lines += ["# HELP eci_scrape_reasons_total URLs whose final outcome had a classified no-data or abort reason.",
+                  "# TYPE eci_scrape_reasons_total counter"]
+        for reason, count in sorted(summary["reasons"].items()):
+            lines.append(f'eci_scrape_reasons_total{{reason="{reason}"}} {count}')
+
+        lines += ["# HELP eci_scrape_urls_per_minute Finished URLs per minute over the run.",
+                  "# TYPE eci_scrape_urls_per_minute gauge",
+                  f"eci_scrape_urls_per_minute {summary['urls_per_minute']:.3f}",
+                  "# HELP eci_scrape_duration_seconds Wall time of the run.",
+                  "# TYPE eci_scrape_duration_seconds gauge",
+                  f"eci_scrape_duration_seconds {summary['duration_seconds']:.3f}"]
+        _write_atomic(path, "\n".join(lines) + "\n")
+
+def _write_atomic(path, text):
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(tmp_path, path)
@@ -0,0 +1,92 @@
+import argparse
+import glob
+import hashlib
+import os
+import pandas as pd
+from eci_dataset import BASE_DIR, load_eci_data
+
+# Captures arrive at irregular times: several on busy days, none for a
+# week when Wayback skipped the page. Differencing them directly turns a
+# skipped week into one "daily" spike. This puts every initiative/country
+# series on a regular grid, interpolates across the gaps (flagging what
+# was imputed) and derives per-bucket gains in one pass over all series.
+
+SERIES_DIR = os.path.join(BASE_DIR, "Series")
+KEY = ["initiative_id", "Country"]
+INPUT_COLUMNS = KEY + ["capture_ts", "Statements of Support"]
+
+def build_series(df, freq="D"):
+    df = df[INPUT_COLUMNS].dropna(subset=["capture_ts"])
+    df = df.astype({"initiative_id": str, "Country": str})
+
+    # Last capture per bucket, one column per (initiative, country)
+    bucket = df["capture_ts"].dt.floor(freq).rename("capture_date")
+    observed = (
+        df.sort_values("capture_ts", kind="stable")
+        .groupby([bucket, df["initiative_id"], df["Country"]])["Statements of Support"]
+        .last()
+        .unstack(KEY)
+        .astype(float)
+    )
+    grid = pd.date_range(observed.index.min(), observed.index.max(), freq=freq, name="capture_date")
+    observed = observed.reindex(grid)
+
+    # Only between real captures; nothing is extrapolated before the first or after the last
+    filled = observed.interpolate(method="time", limit_area="inside")
+    gains = filled.diff()
+    step = grid[1] - grid[0] if len(grid) > 1 else pd.Timedelta(days=1)
+    per_day = pd.Timedelta(days=1) / step
+
+    series = pd.DataFrame({
+        "Statements of Support": filled.stack(KEY),
+        "imputed": (observed.isna() & filled.notna()).stack(KEY),
+        "gain": gains.stack(KEY),
+    })
+    series = series[series["Statements of Support"].notna()].reset_index()
+    series["daily_rate"] = series["gain"] * per_day
+    return series[["initiative_id", "Country", "capture_date", "Statements of Support",
+                   "imputed", "gain", "daily_rate"]]
+
+def to_wide(series, value="gain", initiative_id=None):
+    if initiative_id is not None:
+        series = series[series["initiative_id"] == initiative_id]
+    return series.pivot(index="capture_date", columns="Country", values=value)
+
+def input_fingerprint(df):
+    hashed = pd.util.hash_pandas_object(df[INPUT_COLUMNS].astype({"initiative_id": str, "Country": str}),
+                                        index=False)
+    return hashlib.sha256(hashed.values.tobytes()).hexdigest()[:16]
+
+def load_series(freq="D", initiative_id=None, cache_dir=SERIES_DIR, df=None):
+    # Cached per input fingerprint, so it is rebuilt only after the data changes
+    if df is None:
+        df = load_eci_data(initiative_id=None, columns=INPUT_COLUMNS)
+    fingerprint = input_fingerprint(df)
+    path = os.path.join(cache_dir, f"series_{freq}_{fingerprint}.parquet")
+
+    if os.path.exists(path):
+        series = pd.read_parquet(path)
+    else:
+        series = build_series(df, freq)
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = f"{path}.tmp"
+        series.to_parquet(tmp_path, index=False)
+        os.replace(tmp_path, path)
+        for stale in glob.glob(os.path.join(cache_dir, f"series_{freq}_*.parquet")):
+            if stale != path:
+                os.remove(stale)
+
+    if initiative_id is not None:
+        series = series[series["initiative_id"] == initiative_id].reset_index(drop=True)
+    return series
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the gap-filled signature series cache.")
+    parser.add_argument("--freq", default="D", help="Grid step, e.g. D (daily) or h (hourly)")
+    parser.add_argument("--cache-dir", default=SERIES_DIR)
+    args = parser.parse_args()
+
+    series = load_series(args.freq, cache_dir=args.cache_dir)
+    imputed = series["imputed"].mean() * 100 if len(series) else 0.0
+    print(f"📦 {len(series)} points across {series.groupby(KEY).ngroups} series "
+          f"({imputed:.1f}% imputed) cached in {args.cache_dir}")
@@ -0,0 +1,67 @@
+import argparse
+import json
+import os
+from collections import OrderedDict
+import pandas as pd
+from cdx_client import WAYBACK_PREFIX, archive_url, read_records
+from snapshot_table import extract_capture_date
+
+# Captures that share a CDX digest are byte-identical, so only one page per
+# digest needs scraping. The others can be filled in from its rows.
+
+def group_by_digest(records):
+    groups = OrderedDict()
+    for record in sorted(records, key=lambda r: r["timestamp"]):
+        groups.setdefault(record.get("digest") or record["timestamp"], []).append(record)
+    return groups
+
+def plan_scrape(records, prefix=WAYBACK_PREFIX):
+    groups = {}
+    for members in group_by_digest(records).values():
+        representative = archive_url(members[0], prefix)
+        groups[representative] = [archive_url(m, prefix) for m in members]
+    return groups
+
+def expand_duplicates(df, groups):
+    if df is None or not groups:
+        return df
+
+    frames = [df]
+    for representative, rep_rows in df.groupby("snapshot_url", sort=False):
+        for member in groups.get(representative, []):
+            if member == representative:
+                continue
+            copy = rep_rows.copy()
+            copy["capture_date"], copy["GMT_capture_time"] = extract_capture_date(member)
+            copy["snapshot_url"] = member
+            frames.append(copy)
+    return pd.concat(frames, ignore_index=True)
+
+def load_groups(path):
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Keep one snapshot per CDX digest before scraping.")
+    parser.add_argument("records", help="cdx_<id>.jsonl written by get_snapshot_urls.py")
+    parser.add_argument("--output", default="input_urls.txt")
+    parser.add_argument("--groups", default="digest_groups.json",
+                        help="Representative -> all captures map, for get_snapshot_data.py --expand-duplicates")
+    args = parser.parse_args()
+
+    records = read_records(args.records)
+    groups = plan_scrape(records)
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        for url in groups:
+            f.write(url + "\n")
+
+    tmp_path = f"{args.groups}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(groups, f, indent=1)
+    os.replace(tmp_path, args.groups)
+
+    saved = len(records) - len(groups)
+    rate = saved / len(records) * 100 if records else 0.0
+    print(f"🧬 {len(records)} captures -> {len(groups)} unique digests ({saved} duplicate fetches skipped, {rate:.1f}%)")
+    print(f"📁 Saved to {args.output} and {args.groups}")
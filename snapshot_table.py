@@ -0,0 +1,116 @@
+import re
+from datetime import datetime
+from html.parser import HTMLParser
+import pandas as pd
+
+OUTPUT_COLUMNS = [
+    "capture_date",
+    "GMT_capture_time",
+    "Country",
+    "Statements of Support",
+    "Threshold",
+    "Percentage",
+    "snapshot_url",
+]
+
+# Wayback URLs may carry a mode flag after the timestamp, e.g. "id_" for
+# the original archived bytes without the toolbar or rewritten links
+SNAPSHOT_TIMESTAMP = re.compile(r'/web/(\d{14})(?:[a-z]{2}_)?/')
+
+def extract_capture_date(url):
+    match = SNAPSHOT_TIMESTAMP.search(url)
+    if match:
+        timestamp = match.group(1)
+        dt = datetime.strptime(timestamp, "%Y%m%d%H%M%S")
+        return dt.strftime("%Y-%m-%d"), dt.strftime("%H:%M:%S")
+    return "unknown_date", "unknown_time"
+
+def raw_snapshot_url(url):
+    return SNAPSHOT_TIMESTAMP.sub(r'/web/\1id_/', url, count=1)
+
+def extract_initiative_id(url):
+    match = re.search(r'/initiatives/details/(\d{4}/\d{6})', url)
+    return match.group(1) if match else "unknown"
+
+def add_initiative_id(df):
+    ids = df["snapshot_url"].map(extract_initiative_id, na_action="ignore")
+    df["initiative_id"] = df["initiative_id"].fillna(ids) if "initiative_id" in df.columns else ids
+    return df
+
+class TableRowParser(HTMLParser):
+    # Collects the <td> text of every <tr> inside a <table>, mirroring the
+    # "table tr" / "td" lookups the Selenium engine does.
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.rows = []
+        self._table_depth = 0
+        self._row = None
+        self._cell = None
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "table":
+            self._table_depth += 1
+        elif tag == "tr" and self._table_depth:
+            self._row = []
+            self.rows.append(self._row)
+        elif tag == "td" and self._row is not None:
+            self._cell = []
+        elif tag == "br" and self._cell is not None:
+            self._cell.append(" ")
+
+    def handle_endtag(self, tag):
+        if tag == "td" and self._cell is not None:
+            self._row.append(" ".join("".join(self._cell).split()))
+            self._cell = None
+        elif tag == "tr":
+            self._row = None
+        elif tag == "table" and self._table_depth:
+            self._table_depth -= 1
+
+    def handle_data(self, data):
+        if self._cell is not None:
+            self._cell.append(data)
+
+def parse_table_rows(html):
+    parser = TableRowParser()
+    parser.feed(html)
+    parser.close()
+    return parser.rows
+
+def snapshot_record(url, capture_date, capture_time, cells):
+    return {
+        "capture_date": capture_date,
+        "GMT_capture_time": capture_time,
+        "Country": cells[0].strip(),
+        "Statements of Support": cells[1].strip().replace(',', ''),
+        "Threshold": cells[2].strip().replace(',', ''),
+        "Percentage": cells[3].strip().replace('%', ''),
+        "snapshot_url": url,
+    }
+
+def no_data(info, reason):
+    # Why a page had no rows, for the negative cache
+    if info is not None:
+        info["reason"] = reason
+    return None, "no_data"
+
+def rows_to_snapshot_df(url, rows, info=None):
+    if not rows:
+        print(f"⚠️  Skipped (no table found on page): {url}")
+        return no_data(info, "no_table")
+    if len(rows) <= 1:
+        print(f"⚠️  Skipped (table had only headers or was empty): {url}")
+        return no_data(info, "header_only")
+
+    capture_date, capture_time = extract_capture_date(url)
+    data = [
+        snapshot_record(url, capture_date, capture_time, cells)
+        for cells in rows[1:]
+        if len(cells) == 4
+    ]
+
+    if not data:
+        print(f"⚠️  Skipped (rows found but no valid data): {url}")
+        return no_data(info, "unparsable")
+
+    return pd.DataFrame(data, columns=OUTPUT_COLUMNS), "success"
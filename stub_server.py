@@ -0,0 +1,109 @@
+import argparse
+import json
+import os
+import re
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+# Local stand-in for web.archive.org. Serves saved snapshot HTML from a
+# fixtures folder, where "/web/<timestamp>/..." maps to "<timestamp>.html".
+# Point a scraper at it by swapping the host, e.g.
+#   http://127.0.0.1:8000/web/20250627115346/https://citizens-initiative.europa.eu/...
+# If the folder holds a cdx.json (canned CDX rows, header first), it is also
+# served from /cdx/search/cdx with filters, collapse, limit and resumeKey.
+
+def cdx_response(rows, query):
+    header, body = rows[0], rows[1:]
+    records = [dict(zip(header, row)) for row in body]
+
+    for expr in query.get("filter", []):
+        field, value = expr.split(":", 1)
+        records = [r for r in records if r.get(field) == value]
+    if "from" in query:
+        start = query["from"][0]
+        records = [r for r in records if r["timestamp"] >= start]
+    if "collapse" in query:
+        field, _, length = query["collapse"][0].partition(":")
+        width = int(length) if length else None
+        collapsed = []
+        for record in records:
+            value = record[field][:width]
+            if not collapsed or collapsed[-1][field][:width] != value:
+                collapsed.append(record)
+        records = collapsed
+
+    offset = int(query.get("resumeKey", ["0"])[0])
+    limit = int(query.get("limit", [str(len(records))])[0])
+    page = records[offset:offset + limit]
+
+    out = [header] + [[r[field] for field in header] for r in page]
+    if offset + limit < len(records) and query.get("showResumeKey") == ["true"]:
+        out += [[], [str(offset + limit)]]
+    return out
+
+def make_handler(fixtures_dir, latency=0.0):
+    class SnapshotHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if latency:
+                time.sleep(latency)
+
+            parsed = urlparse(self.path)
+            if parsed.path == "/cdx/search/cdx":
+                self.serve_cdx(parse_qs(parsed.query))
+                return
+
+            match = re.search(r'/web/(\d{14})', self.path)
+            path = os.path.join(fixtures_dir, f"{match.group(1)}.html") if match else None
+            if path is None or not os.path.exists(path):
+                path = os.path.join(fixtures_dir, "default.html")
+            if not os.path.exists(path):
+                self.send_error(404)
+                return
+
+            with open(path, "rb") as f:
+                body = f.read()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html; charset=utf-8")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def serve_cdx(self, query):
+            path = os.path.join(fixtures_dir, "cdx.json")
+            if not os.path.exists(path):
+                self.send_error(404)
+                return
+            with open(path, "r", encoding="utf-8") as f:
+                rows = json.load(f)
+
+            body = json.dumps(cdx_response(rows, query)).encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            pass
+
+    return SnapshotHandler
+
+def serve(fixtures_dir, host="127.0.0.1", port=8000, latency=0.0):
+    server = ThreadingHTTPServer((host, port), make_handler(fixtures_dir, latency))
+    print(f"🧪 Serving fixtures from '{fixtures_dir}' on http://{host}:{server.server_port}")
+    return server
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve saved Wayback snapshot HTML locally.")
+    parser.add_argument("fixtures_dir")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds to delay each response")
+    args = parser.parse_args()
+
+    server = serve(args.fixtures_dir, args.host, args.port, args.latency)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
@@ -0,0 +1,26 @@
+import os
+import sys
+import threading
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES_DIR = os.path.join(ROOT, "tests", "fixtures")
+sys.path.insert(0, ROOT)
+
+from stub_server import serve
+
+@pytest.fixture
+def stub_server():
+    # Starts the local Wayback stand-in on a free port; call it with a fixtures folder
+    servers = []
+
+    def start(fixtures_dir=FIXTURES_DIR):
+        server = serve(fixtures_dir, port=0)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        servers.append(server)
+        return f"http://127.0.0.1:{server.server_port}"
+
+    yield start
+    for server in servers:
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,93 @@
+import json
+import os
+import shutil
+import pytest
+from cdx_client import iter_cdx_pages, list_snapshots, load_state, read_records
+from http_engine import create_session
+from conftest import FIXTURES_DIR
+
+URL = "https://citizens-initiative.europa.eu/initiatives/details/2024/000007_en"
+
+@pytest.fixture
+def cdx_dir(tmp_path):
+    # A private copy, so tests can add captures to the listing
+    fixtures_dir = tmp_path / "fixtures"
+    fixtures_dir.mkdir()
+    shutil.copy(os.path.join(FIXTURES_DIR, "cdx.json"), fixtures_dir)
+    return fixtures_dir
+
+def timestamps(records):
+    return [record["timestamp"] for record in records]
+
+class FailingSession:
+    # Lets the first n requests through, then fails like a dropped connection
+    def __init__(self, n):
+        self.session = create_session(1)
+        self.left = n
+
+    def get(self, *args, **kwargs):
+        if self.left == 0:
+            raise ConnectionError("connection dropped")
+        self.left -= 1
+        return self.session.get(*args, **kwargs)
+
+def test_pages_follow_the_resume_key(stub_server):
+    endpoint = f"{stub_server()}/cdx/search/cdx"
+    with create_session(1) as session:
+        pages = list(iter_cdx_pages(session, URL, endpoint=endpoint, page_size=2))
+
+    assert [len(records) for records, _ in pages] == [2, 2, 2, 1]
+    assert [resume_key for _, resume_key in pages] == ["2", "4", "6", None]
+
+def test_filters_drop_errors_and_revisits(stub_server):
+    endpoint = f"{stub_server()}/cdx/search/cdx"
+    with create_session(1) as session:
+        records = [r for records, _ in iter_cdx_pages(session, URL, endpoint=endpoint) for r in records]
+
+    assert timestamps(records) == ["20250101000000", "20250101060000", "20250102120000", "20250103120000",
+                                   "20250104000000", "20250105000000", "20250106000000"]
+    assert {(r["statuscode"], r["mimetype"]) for r in records} == {("200", "text/html")}
+
+@pytest.mark.parametrize("collapse, dropped", [
+    ("digest", "20250104000000"),        # same digest as the capture before it
+    ("timestamp:8", "20250101060000"),   # second capture of the same day
+])
+def test_collapse(stub_server, tmp_path, collapse, dropped):
+    endpoint = f"{stub_server()}/cdx/search/cdx"
+    written, links_path, records_path = list_snapshots(URL, tmp_path / "out", endpoint=endpoint,
+                                                       collapse=collapse, page_size=2)
+
+    records = read_records(records_path)
+    assert written == len(records) == 6
+    assert dropped not in timestamps(records)
+
+def test_resume_only_fetches_newer_captures(stub_server, cdx_dir, tmp_path):
+    endpoint = f"{stub_server(str(cdx_dir))}/cdx/search/cdx"
+    out_dir = tmp_path / "out"
+    first, links_path, records_path = list_snapshots(URL, out_dir, endpoint=endpoint, page_size=2)
+
+    rows = json.loads((cdx_dir / "cdx.json").read_text())
+    rows.append(rows[-1][:1] + ["20250107000000"] + rows[-1][2:5] + ["F", "5120"])
+    (cdx_dir / "cdx.json").write_text(json.dumps(rows))
+
+    second, _, _ = list_snapshots(URL, out_dir, endpoint=endpoint, page_size=2)
+    records = read_records(records_path)
+    assert (first, second) == (6, 1)
+    assert timestamps(records)[-2:] == ["20250106000000", "20250107000000"]
+    assert load_state(os.path.join(out_dir, "cdx_2024_000007.state.json"))["last_timestamp"] == "20250107000000"
+    with open(links_path, encoding="utf-8") as f:
+        assert len(f.read().splitlines()) == 7
+
+def test_interrupted_listing_resumes_without_duplicates(stub_server, tmp_path):
+    endpoint = f"{stub_server()}/cdx/search/cdx"
+    out_dir = tmp_path / "out"
+    with pytest.raises(ConnectionError):
+        list_snapshots(URL, out_dir, endpoint=endpoint, page_size=2, session=FailingSession(2))
+
+    state = load_state(os.path.join(out_dir, "cdx_2024_000007.state.json"))
+    assert state == {"last_timestamp": "20250103120000", "resume_key": "4"}
+
+    written, _, records_path = list_snapshots(URL, out_dir, endpoint=endpoint, page_size=2)
+    records = read_records(records_path)
+    assert written == 2
+    assert len(timestamps(records)) == len(set(timestamps(records))) == 6
@@ -0,0 +1,41 @@
+from http_engine import create_session, scrape_with_http
+from snapshot_table import OUTPUT_COLUMNS
+
+PAGE = "/web/{}/https://citizens-initiative.europa.eu/initiatives/details/2024/000007_en"
+
+def scrape(base_url, timestamp, **kwargs):
+    info = {}
+    with create_session(1) as session:
+        df, status = scrape_with_http(base_url + PAGE.format(timestamp), session, info=info, **kwargs)
+    return df, status, info
+
+def test_table_page_gives_snapshot_rows(stub_server):
+    df, status, _ = scrape(stub_server(), "20250627115346")
+
+    assert status == "success"
+    assert list(df.columns) == OUTPUT_COLUMNS
+    assert df["Country"].tolist() == ["Austria", "Belgium"]
+    assert df.iloc[0][["Statements of Support", "Threshold", "Percentage"]].tolist() == ["10326", "13395", "77.09"]
+    assert (df["capture_date"].unique().tolist(), df["GMT_capture_time"].unique().tolist()) == (["2025-06-27"],
+                                                                                              ["11:53:46"])
+
+def test_wayback_error_page_is_no_data(stub_server):
+    df, status, info = scrape(stub_server(), "20250101000300")
+    assert (df, status, info["reason"]) == (None, "no_data", "wayback_error")
+
+def test_header_only_table_is_no_data(stub_server):
+    df, status, info = scrape(stub_server(), "20250103000000")
+    assert (df, status, info["reason"]) == (None, "no_data", "header_only")
+
+def test_missing_capture_is_no_data(stub_server):
+    df, status, info = scrape(stub_server(), "20250109000000")
+    assert (df, status, info["reason"]) == (None, "no_data", "http_error")
+
+def test_script_rendered_page_falls_back_to_the_browser(stub_server):
+    calls = []
+    fallback = lambda url: calls.append(url) or (None, "no_data")
+
+    base_url = stub_server()
+    _, status, _ = scrape(base_url, "20250102000000", fallback=fallback)
+    assert status == "no_data"
+    assert calls == [base_url + PAGE.format("20250102000000")]
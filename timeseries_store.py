@@ -0,0 +1,153 @@
+import argparse
+import os
+import sqlite3
+import pandas as pd
+from eci_dataset import BASE_DIR, DEFAULT_INITIATIVE, dataset_mtime, load_eci_data, normalize
+
+# Every capture keyed by (initiative, country, capture timestamp) in SQLite.
+# The primary key doubles as the index for "latest value at or before T"
+# lookups, range scans and daily/hourly bucketing, so analyses no longer
+# filter and pivot the whole frame to find one state.
+
+STORE_PATH = os.path.join(BASE_DIR, "eci_timeseries.sqlite3")
+TS_FORMAT = "%Y-%m-%d %H:%M:%S"
+# Bucket key = prefix of the sortable timestamp text
+BUCKET_WIDTHS = {"D": 10, "h": 13}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS captures (
+    initiative_id TEXT NOT NULL,
+    country TEXT NOT NULL,
+    capture_ts TEXT NOT NULL,
+    support INTEGER,
+    threshold INTEGER,
+    percentage REAL,
+    snapshot_url TEXT,
+    PRIMARY KEY (initiative_id, country, capture_ts)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS captures_by_time ON captures (initiative_id, capture_ts);
+"""
+
+OUTPUT_NAMES = {
+    "country": "Country",
+    "capture_ts": "capture_ts",
+    "support": "Statements of Support",
+    "threshold": "Threshold",
+    "percentage": "Percentage",
+    "snapshot_url": "snapshot_url",
+}
+
+def _ts(value):
+    return pd.Timestamp(value).strftime(TS_FORMAT)
+
+def _where(initiative_id, start=None, end=None, countries=None):
+    clause = "initiative_id = ? AND capture_ts >= ? AND capture_ts <= ?"
+    params = [initiative_id, _ts(start) if start is not None else "", _ts(end) if end is not None else "9999"]
+    if countries:
+        clause += f" AND country IN ({', '.join('?' for _ in countries)})"
+        params += list(countries)
+    return clause, params
+
+def _frame(rows, columns):
+    df = pd.DataFrame(rows, columns=columns).rename(columns=OUTPUT_NAMES)
+    if "capture_ts" in df.columns:
+        df["capture_ts"] = pd.to_datetime(df["capture_ts"], format=TS_FORMAT)
+    for column in ("Statements of Support", "Threshold"):
+        if column in df.columns:
+            df[column] = df[column].astype("Int64")
+    return df
+
+class TimeSeriesStore:
+    def __init__(self, path=STORE_PATH):
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        self._conn.executescript(SCHEMA)
+
+    def close(self):
+        self._conn.close()
+
+    def upsert(self, df):
+        df = normalize(df) if "capture_ts" not in df.columns else df
+        df = df.dropna(subset=["capture_ts"])
+        urls = df["snapshot_url"] if "snapshot_url" in df.columns else pd.Series(None, index=df.index)
+        records = zip(
+            df["initiative_id"].astype(str),
+            df["Country"].astype(str),
+            df["capture_ts"].dt.strftime(TS_FORMAT),
+            (None if pd.isna(v) else int(v) for v in df["Statements of Support"]),
+            (None if pd.isna(v) else int(v) for v in df["Threshold"]),
+            (None if pd.isna(v) else float(v) for v in df["Percentage"]),
+            urls.astype(object).where(urls.notna(), None),
+        )
+        with self._conn:
+            self._conn.executemany("INSERT OR REPLACE INTO captures VALUES (?, ?, ?, ?, ?, ?, ?)", records)
+        return len(df)
+
+    def is_empty(self):
+        return self._conn.execute("SELECT 1 FROM captures LIMIT 1").fetchone() is None
+
+    def as_of(self, when=None, initiative_id=DEFAULT_INITIATIVE, countries=None):
+        # Latest capture at or before `when` for every country (the newest overall if when is None)
+        clause, params = _where(initiative_id, end=when, countries=countries)
+        query = (
+            "SELECT country, MAX(capture_ts) AS capture_ts, support, threshold, percentage, snapshot_url "
+            f"FROM captures WHERE {clause} GROUP BY country ORDER BY country"
+        )
+        cursor = self._conn.execute(query, params)
+        return _frame(cursor.fetchall(), [d[0] for d in cursor.description])
+
+    def range(self, start=None, end=None, initiative_id=DEFAULT_INITIATIVE, countries=None):
+        clause, params = _where(initiative_id, start, end, countries)
+        query = (
+            "SELECT country, capture_ts, support, threshold, percentage, snapshot_url FROM captures "
+            f"WHERE {clause} ORDER BY capture_ts, country"
+        )
+        cursor = self._conn.execute(query, params)
+        return _frame(cursor.fetchall(), [d[0] for d in cursor.description])
+
+    def resample(self, freq="D", column="support", start=None, end=None, initiative_id=DEFAULT_INITIATIVE,
+                 countries=None):
+        # Last capture per country and bucket, as a bucket x country frame.
+        # SQLite takes the bare column from the row that holds MAX(capture_ts).
+        if column not in ("support", "threshold", "percentage"):
+            raise ValueError(f"Unknown column: {column}")
+        width = BUCKET_WIDTHS[freq]
+        clause, params = _where(initiative_id, start, end, countries)
+        query = (
+            f"SELECT substr(capture_ts, 1, {width}) AS bucket, country, MAX(capture_ts), {column} "
+            f"FROM captures WHERE {clause} GROUP BY bucket, country"
+        )
+        rows = self._conn.execute(query, params).fetchall()
+        long = pd.DataFrame(rows, columns=["bucket", "Country", "capture_ts", OUTPUT_NAMES[column]])
+        wide = long.pivot(index="bucket", columns="Country", values=OUTPUT_NAMES[column])
+        wide.index = pd.to_datetime(wide.index, format="%Y-%m-%d" if freq == "D" else "%Y-%m-%d %H")
+        wide.index.name = "capture_date" if freq == "D" else "capture_hour"
+        wide.columns.name = "Country"
+        return wide.sort_index()
+
+def open_store(path=STORE_PATH):
+    # Built from the dataset on first use, and refreshed whenever the dataset changed since
+    stale = not os.path.exists(path) or os.path.getmtime(path) < dataset_mtime()
+    store = TimeSeriesStore(path)
+    if stale or store.is_empty():
+        store.upsert(load_eci_data(initiative_id=None))
+        os.utime(path)
+    return store
+
+def ingest(new_rows, path=STORE_PATH):
+    # Seeded from the full dataset first, so a new store never holds just this chunk
+    store = open_store(path)
+    try:
+        return store.upsert(new_rows)
+    finally:
+        store.close()
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Rebuild the SQLite time-series store from the full dataset.")
+    parser.add_argument("--path", default=STORE_PATH)
+    args = parser.parse_args()
+
+    store = TimeSeriesStore(args.path)
+    written = store.upsert(load_eci_data(initiative_id=None))
+    store.close()
+    print(f"📦 {written} captures stored in {args.path}")